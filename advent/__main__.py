@@ -0,0 +1,30 @@
+import argparse
+import logging
+import sys
+
+from advent import bench, runner, startup
+from advent.log import setup_logging
+
+parser = argparse.ArgumentParser(prog="python -m advent")
+parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
+subparsers = parser.add_subparsers(title="commands")
+runner.configure(subparsers.add_parser("run", help="Run every solver once"))
+bench.configure(subparsers.add_parser("bench", help="Benchmark solver phases"))
+bench.configure_compare(
+    subparsers.add_parser("compare", help="Compare benchmark results to a baseline")
+)
+
+startup.configure(
+    subparsers.add_parser("startup", help="Report cold import time for each day")
+)
+
+# The runner's child processes import this module again, so only the real
+# entry point should actually do anything
+if __name__ == "__main__":
+    # With no command (just `python -m advent`, or only top-level flags like -v)
+    # run everything
+    args = parser.parse_args()
+    if not hasattr(args, "func"):
+        args = parser.parse_args([*sys.argv[1:], "run"])
+    setup_logging(logging.DEBUG if args.verbose else logging.WARNING)
+    args.func(args)
@@ -1,31 +1,80 @@
 # /usr/bin/env python3
+from __future__ import annotations
 
 import abc
 import argparse
+import contextlib
+import dataclasses
+import functools
 import inspect
 import logging
 import pathlib
 import time
-from typing import Generator
-
-import aocd
-from rich.console import RenderableType
-from rich.live import Live
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ContextManager,
+    Generator,
+    Iterator,
+    Sequence,
+)
 
+from advent import inputs, memory, profiling
 from advent.colors import blue, green
-from advent.log import ColoredLogFormatter
+from advent.log import setup_logging
+from advent.reader import Source
+
+# aocd, rich and numpy (via the input view) each take tens of milliseconds to
+# import, which is most of the runtime for the easy days. They're imported where
+# they're used instead so runs that don't need them never pay for them.
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    from rich.live import Live
+
+    from advent.view import InputView
 
 Result = str | int
 Solution = Generator[Result | None, None, None]
+# Called with the phase name, and wraps that phase (e.g. to profile it)
+PhaseHook = Callable[[str], ContextManager[None]]
+
+PHASES = ("parse", "part1", "part2")
+
+
+@dataclasses.dataclass
+class PhaseResult:
+    phase: str
+    answer: Result | None
+    elapsed_ns: int
+
+    @property
+    def elapsed(self) -> float:
+        return self.elapsed_ns / 1e9
+
+
+@dataclasses.dataclass
+class TimedSolution:
+    part1: Result | None
+    part2: Result | None
+    parse_ns: int
+    part1_ns: int
+    part2_ns: int
 
 
 class BaseSolver(abc.ABC):
-    def __init__(self, data: str, is_example: bool = False) -> None:
+    # Streaming solvers only read their input through self.source, so the harness
+    # hands them a memory-mapped file instead of loading the whole thing as a str
+    streaming = False
+
+    def __init__(self, data: str | Source, is_example: bool = False) -> None:
         self.logger = logging.getLogger()
-        self.data = data
+        if isinstance(data, Source):
+            self.source = data
+        else:
+            self.data = data
+            self.source = Source.from_text(data)
         self.is_example = is_example
         self.is_real = not is_example
-        self.live = Live()
 
     @classmethod
     def day(cls) -> int:
@@ -37,12 +86,71 @@ class BaseSolver(abc.ABC):
         filepath = pathlib.Path(inspect.getfile(cls))
         return filepath.parent / "resources" / f"{filepath.stem}.txt"
 
-    def submit(self, part1: Result | None, part2: Result | None) -> None:
-        self.logger.info("Submitting answers to Advent of Code")
+    @classmethod
+    def get_input(
+        cls,
+        input_path: pathlib.Path | None = None,
+        input_dir: pathlib.Path | None = None,
+        scale: int | None = None,
+        seed: int = 0,
+    ) -> str | Source:
+        if scale is not None:
+            from advent import generators
+
+            return generators.generate(cls.day(), scale=scale, seed=seed)
+        if cls.streaming:
+            return Source.from_path(
+                inputs.path_for(cls.day(), input_path=input_path, input_dir=input_dir)
+            )
+        return inputs.load(cls.day(), input_path=input_path, input_dir=input_dir)
+
+    @classmethod
+    def phases(
+        cls,
+        data: str | Source,
+        is_example: bool = False,
+        hooks: Sequence[PhaseHook] = (),
+    ) -> Iterator[PhaseResult]:
+        # Anything a solver does in __init__ counts as parsing. Solvers that parse
+        # lazily inside solve() will still have that folded into part 1.
+        with contextlib.ExitStack() as stack:
+            for hook in hooks:
+                stack.enter_context(hook("parse"))
+            start = time.perf_counter_ns()
+            solver = cls(data, is_example=is_example)
+            elapsed = time.perf_counter_ns() - start
+        yield PhaseResult("parse", None, elapsed)
+
+        solution = solver.solve()
+        for phase in PHASES[1:]:
+            with contextlib.ExitStack() as stack:
+                for hook in hooks:
+                    stack.enter_context(hook(phase))
+                start = time.perf_counter_ns()
+                answer = next(solution)
+                elapsed = time.perf_counter_ns() - start
+            yield PhaseResult(phase, answer, elapsed)
+
+    @classmethod
+    def solve_timed(cls, data: str | Source, is_example: bool = False) -> TimedSolution:
+        parse, part1, part2 = cls.phases(data, is_example=is_example)
+        return TimedSolution(
+            part1.answer,
+            part2.answer,
+            parse.elapsed_ns,
+            part1.elapsed_ns,
+            part2.elapsed_ns,
+        )
+
+    @classmethod
+    def submit(cls, part1: Result | None, part2: Result | None) -> None:
+        import aocd
+
+        logging.getLogger().info("Submitting answers to Advent of Code")
         if part1 is not None:
-            aocd.post.submit(part1, part="a", day=self.day(), year=2023)
+            aocd.post.submit(part1, part="a", day=cls.day(), year=2023)
         if part2 is not None:
-            aocd.post.submit(part2, part="b", day=self.day(), year=2023)
+            aocd.post.submit(part2, part="b", day=cls.day(), year=2023)
 
     @classmethod
     def run(cls) -> None:
@@ -51,15 +159,65 @@ class BaseSolver(abc.ABC):
         parser.add_argument("--part1", help="Part 1 example solution")
         parser.add_argument("--part2", help="Part 2 example solution")
         parser.add_argument("--no-submit", action="store_true", help="Don't submit")
+        parser.add_argument("--input", type=pathlib.Path, help="Read input from here")
+        parser.add_argument(
+            "--input-dir", type=pathlib.Path, help="Read input from DIR/dayNN.txt"
+        )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            help="Solve a generated input N times the size of the real one",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed for --scale (default: 0)"
+        )
+        parser.add_argument(
+            "--profile", action="store_true", help="Profile each phase with cProfile"
+        )
+        parser.add_argument(
+            "--profile-dir",
+            type=pathlib.Path,
+            default=profiling.PROFILE_DIR,
+            help="Where to write profiles",
+        )
+        parser.add_argument(
+            "--mem", action="store_true", help="Track peak memory for each phase"
+        )
+        parser.add_argument(
+            "--mem-top",
+            type=int,
+            default=0,
+            help="With --mem, also show the N biggest allocation sites",
+        )
+        parser.add_argument(
+            "--startup-report",
+            action="store_true",
+            help="Show what importing this solver costs, then exit",
+        )
         parser.add_argument(
             "-v", "--verbose", action="store_true", help="Verbose logging"
         )
         args = parser.parse_args()
 
+        if args.startup_report:
+            from rich.console import Console
+
+            from advent import startup
+
+            module = f"advent.{pathlib.Path(inspect.getfile(cls)).stem}"
+            Console().print(startup.report(module))
+            return
+
+        def hooks(label: str) -> list[PhaseHook]:
+            res: list[PhaseHook] = []
+            if args.profile:
+                res.append(profiling.PhaseProfiler(cls.day(), label, args.profile_dir))
+            if args.mem:
+                res.append(memory.PhaseMemory(top=args.mem_top))
+            return res
+
         # Set up logging
-        logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
-        logger = logging.getLogger()
-        logger.handlers[0].setFormatter(ColoredLogFormatter())
+        logger = setup_logging(logging.DEBUG if args.verbose else logging.INFO)
 
         # Run example if it exists
         example_path = cls.example_path()
@@ -69,50 +227,66 @@ class BaseSolver(abc.ABC):
                 example_input = f.read()
             logger.debug("Read example input")
 
-            start = time.time()
-            example_solution = cls(example_input, is_example=True).solve()
-            part1 = next(example_solution)
-            elapsed = time.time() - start
-            if args.part1 is not None and str(part1) != args.part1:
-                logger.fatal(f"Expected {args.part1}, but got {part1}")
+            parse, part1, part2 = cls.phases(
+                example_input, is_example=True, hooks=hooks("example")
+            )
+            elapsed = parse.elapsed + part1.elapsed
+            if args.part1 is not None and str(part1.answer) != args.part1:
+                logger.fatal(f"Expected {args.part1}, but got {part1.answer}")
                 exit(1)
 
-            part2 = next(example_solution)
-            if args.part2 is not None and str(part2) != args.part2:
-                logger.fatal(f"Expected {args.part2}, but got {part2}")
+            if args.part2 is not None and str(part2.answer) != args.part2:
+                logger.fatal(f"Expected {args.part2}, but got {part2.answer}")
                 exit(1)
             if args.part1 is not None or args.part2 is not None:
                 logger.info(f"Example solution matches expected (took {elapsed:.2f}s)")
         else:
             logger.warning("No example input found")
 
-        data = aocd.get_data(day=cls.day(), year=2023)
-        solver = cls(data)
-        start = time.time()
-        solution = solver.solve()
-        part1 = next(solution)
-        elapsed = time.time() - start
-        s = green(f"Solution 1: {part1}") + blue(f" (took {elapsed:.2f}s)")
-        logger.info(s)
-
-        start = time.time()
-        part2 = next(solution)
-        if part2 is not None:
-            elapsed = time.time() - start
-            s = green(f"Solution 2: {part2}") + blue(f" (took {elapsed:.2f}s)")
-            logger.info(s)
+        data = cls.get_input(
+            input_path=args.input,
+            input_dir=args.input_dir,
+            scale=args.scale,
+            seed=args.seed,
+        )
+        answers: dict[str, Result | None] = {}
+        for res in cls.phases(data, hooks=hooks("real")):
+            answers[res.phase] = res.answer
+            if res.phase == "parse":
+                logger.info(blue(f"Parsed input (took {res.elapsed:.2f}s)"))
+            elif res.phase == "part1" or res.answer is not None:
+                s = green(f"Solution {res.phase[-1]}: {res.answer}")
+                logger.info(s + blue(f" (took {res.elapsed:.2f}s)"))
         print("-------------------------")
 
-        if not args.no_submit:
-            solver.submit(part1, part2)
+        # Generated inputs have nothing to do with the real answers
+        if not args.no_submit and args.scale is None:
+            cls.submit(answers["part1"], answers["part2"])
+
+    @functools.cached_property
+    def live(self) -> Live:
+        from rich.live import Live
+
+        return Live()
 
     def show_state(self, state: RenderableType) -> None:
         self.live.update(state)
 
-    @property
+    @functools.cached_property
+    def data(self) -> str:
+        # Only reached for a Source, since otherwise __init__ sets data directly
+        return self.source.read()
+
+    @functools.cached_property
     def lines(self) -> list[str]:
         return self.data.splitlines()
 
+    @functools.cached_property
+    def view(self) -> InputView:
+        from advent.view import InputView
+
+        return InputView(self.data)
+
     @abc.abstractmethod
     def solve(self) -> Solution:
         ...
@@ -0,0 +1,209 @@
+import argparse
+import dataclasses
+import json
+import math
+import pathlib
+import statistics
+import sys
+from typing import Callable
+
+from rich.console import Console
+from rich.table import Table
+
+from advent import registry
+from advent.base import PHASES
+from advent.colors import red
+from advent.paths import STATE_DIR
+
+BENCH_PATH = STATE_DIR / "bench.json"
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    samples_ns: list[int]
+
+    @property
+    def min_ns(self) -> int:
+        return min(self.samples_ns)
+
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples_ns)
+
+    @property
+    def p95_ns(self) -> int:
+        # Nearest-rank percentile, so it's always one of the observed samples
+        ordered = sorted(self.samples_ns)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def to_dict(self) -> dict[str, float | list[int]]:
+        return {
+            "min_ns": self.min_ns,
+            "median_ns": self.median_ns,
+            "p95_ns": self.p95_ns,
+            "samples_ns": self.samples_ns,
+        }
+
+
+def bench_day(
+    day: int,
+    warmup: int,
+    repeat: int,
+    input_dir: pathlib.Path | None = None,
+    scale: int | None = None,
+    seed: int = 0,
+) -> dict[str, PhaseStats]:
+    solver_cls = registry.load(day)
+    data = solver_cls.get_input(input_dir=input_dir, scale=scale, seed=seed)
+    for _ in range(warmup):
+        for _ in solver_cls.phases(data):
+            pass
+
+    stats = {phase: PhaseStats([]) for phase in PHASES}
+    for _ in range(repeat):
+        for res in solver_cls.phases(data):
+            stats[res.phase].samples_ns.append(res.elapsed_ns)
+    return stats
+
+
+def report(results: dict[int, dict[str, PhaseStats]]) -> Table:
+    table = Table(title="Benchmark (ms)")
+    table.add_column("Day", justify="right")
+    for phase in PHASES:
+        for stat in ("min", "median", "p95"):
+            table.add_column(f"{phase} {stat}", justify="right")
+    for day, stats in results.items():
+        row = [str(day)]
+        for phase in PHASES:
+            s = stats[phase]
+            row += [f"{ns / 1e6:.2f}" for ns in (s.min_ns, s.median_ns, s.p95_ns)]
+        table.add_row(*row)
+    return table
+
+
+def at_least(lowest: int) -> Callable[[str], int]:
+    # Named so argparse reports a bad value as an "invalid integer value"
+    def integer(s: str) -> int:
+        n = int(s)
+        if n < lowest:
+            raise argparse.ArgumentTypeError(f"must be at least {lowest}, got {n}")
+        return n
+
+    return integer
+
+
+def configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("days", nargs="*", type=int, help="Days to run (default: all)")
+    parser.add_argument(
+        "--warmup",
+        type=at_least(0),
+        default=1,
+        help="Untimed runs per day (default: 1)",
+    )
+    parser.add_argument(
+        "--repeat", type=at_least(1), default=5, help="Timed runs per day (default: 5)"
+    )
+    parser.add_argument(
+        "--input-dir", type=pathlib.Path, help="Read inputs from DIR/dayNN.txt"
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        help="Benchmark generated inputs N times the size of the real ones",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for --scale (default: 0)"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=BENCH_PATH,
+        help=f"Where to write results (default: {BENCH_PATH})",
+    )
+    parser.set_defaults(func=main)
+
+
+def main(args: argparse.Namespace) -> None:
+    results = {}
+    for day in args.days or registry.days():
+        results[day] = bench_day(
+            day, args.warmup, args.repeat, args.input_dir, args.scale, args.seed
+        )
+    Console().print(report(results))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(
+            {
+                "warmup": args.warmup,
+                "repeat": args.repeat,
+                "scale": args.scale,
+                "seed": args.seed,
+                "days": {
+                    str(day): {phase: s.to_dict() for phase, s in stats.items()}
+                    for day, stats in results.items()
+                },
+            },
+            f,
+            indent=2,
+        )
+
+
+def configure_compare(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("baseline", type=pathlib.Path, help="Saved benchmark results")
+    parser.add_argument(
+        "current",
+        type=pathlib.Path,
+        nargs="?",
+        default=BENCH_PATH,
+        help=f"Results to check (default: {BENCH_PATH})",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Flag medians slower than baseline by this fraction (default: 0.10)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="Ignore slowdowns smaller than this, they're just noise (default: 1.0)",
+    )
+    parser.set_defaults(func=compare)
+
+
+def compare(args: argparse.Namespace) -> None:
+    with open(args.baseline) as f:
+        baseline = json.load(f)["days"]
+    with open(args.current) as f:
+        current = json.load(f)["days"]
+
+    table = Table(title=f"{args.current} vs {args.baseline} (median ms)")
+    table.add_column("Day", justify="right")
+    table.add_column("Phase")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    regressions = 0
+    for day in sorted(set(baseline) & set(current), key=int):
+        for phase in PHASES:
+            before = baseline[day][phase]["median_ns"] / 1e6
+            after = current[day][phase]["median_ns"] / 1e6
+            change = (after - before) / before if before > 0 else 0.0
+            regressed = change > args.threshold and after - before > args.min_delta_ms
+            regressions += regressed
+            table.add_row(
+                day,
+                phase,
+                f"{before:.2f}",
+                f"{after:.2f}",
+                f"[red]{change:+.1%}" if regressed else f"{change:+.1%}",
+            )
+    Console().print(table)
+
+    if regressions > 0:
+        msg = f"{regressions} phase(s) regressed by more than {args.threshold:.0%}"
+        print(red(msg))
+        sys.exit(1)
@@ -0,0 +1,123 @@
+import ast
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import pathlib
+
+from advent.base import TimedSolution
+from advent.paths import STATE_DIR
+from advent.reader import Source
+
+# One small JSON file per result. A result is only reused if the input and the
+# source of the solver (and everything it imports from advent) are unchanged.
+CACHE_DIR = STATE_DIR / "results"
+MAX_BYTES = 10 * 1024 * 1024
+ROOT_DIR = pathlib.Path(__file__).parent.parent
+
+
+def module_path(name: str) -> pathlib.Path | None:
+    # Resolved by hand rather than with importlib so that hashing never has to
+    # import anything
+    base = ROOT_DIR.joinpath(*name.split("."))
+    for path in (base.with_suffix(".py"), base / "__init__.py"):
+        if path.is_file():
+            return path
+    return None
+
+
+def advent_imports(name: str, path: pathlib.Path) -> set[str]:
+    res = set()
+    for node in ast.walk(ast.parse(path.read_text(), str(path))):
+        if isinstance(node, ast.Import):
+            res |= {alias.name for alias in node.names}
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            res.add(node.module)
+            # `from advent import graph` imports a module, but
+            # `from advent.base import BaseSolver` doesn't
+            for alias in node.names:
+                sub = f"{node.module}.{alias.name}"
+                if module_path(sub) is not None:
+                    res.add(sub)
+    return {m for m in res if m.split(".")[0] == "advent" and m != name}
+
+
+@functools.cache
+def source_hash(name: str) -> str:
+    # Hash the module along with everything it transitively imports from advent,
+    # so a change to e.g. advent.graph invalidates every day that uses it
+    h = hashlib.sha256()
+    seen = set()
+    todo = [name]
+    while todo:
+        module = todo.pop()
+        if module in seen:
+            continue
+        seen.add(module)
+        path = module_path(module)
+        if path is None:
+            continue
+        todo += advent_imports(module, path)
+    for module in sorted(seen):
+        path = module_path(module)
+        if path is not None:
+            h.update(module.encode() + b"\0" + path.read_bytes() + b"\0")
+    return h.hexdigest()
+
+
+def key(day: int, module: str, data: str | Source) -> str:
+    if isinstance(data, Source):
+        input_hash = data.digest()
+    else:
+        input_hash = hashlib.sha256(data.encode()).hexdigest()
+    return hashlib.sha256(
+        f"{day}\0{input_hash}\0{source_hash(module)}".encode()
+    ).hexdigest()
+
+
+def entry_path(digest: str) -> pathlib.Path:
+    return CACHE_DIR / f"{digest}.json"
+
+
+def get(digest: str) -> TimedSolution | None:
+    path = entry_path(digest)
+    try:
+        with open(path) as f:
+            res = TimedSolution(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+    # Eviction goes by mtime, so a hit counts as a use
+    path.touch()
+    return res
+
+
+def put(digest: str, result: TimedSolution, max_bytes: int = MAX_BYTES) -> None:
+    path = entry_path(digest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(dataclasses.asdict(result), f)
+    tmp.replace(path)
+    evict(max_bytes)
+
+
+def evict(max_bytes: int = MAX_BYTES) -> None:
+    # Least recently used first
+    entries = []
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
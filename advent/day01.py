@@ -1,29 +1,52 @@
 # /usr/bin/env python3
+import itertools
+import re
 
 from advent.base import BaseSolver, Solution
 
+NUMS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+VALUES = {str(i): i for i in range(10)} | {n: i for i, n in enumerate(NUMS, start=1)}
+BATCH = 4096
+
+
+def compile_matchers(words: bool) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    target = "[0-9]" + "".join(f"|{n}" for n in NUMS if words)
+    # A lazy prefix stops at the first match on each line, and a greedy one backs
+    # off from the end of the line to the last. Both stay within one line because
+    # . doesn't match newlines, and the greedy one still finds matches that
+    # overlap an earlier one, like the "one" in "twone".
+    first = re.compile(f"^.*?({target})", re.MULTILINE)
+    last = re.compile(f"^.*({target})", re.MULTILINE)
+    return first, last
+
+
+MATCHERS = {words: compile_matchers(words) for words in (False, True)}
+
+
+def calibration_sum(text: str, words: bool = False) -> int:
+    # Works on any number of lines at once, so the scanning all happens in C
+    first, last = MATCHERS[words]
+    return sum(
+        10 * VALUES[a] + VALUES[b]
+        for a, b in zip(first.findall(text), last.findall(text))
+    )
+
 
 class Solver(BaseSolver):
-    NUMS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+    streaming = True
 
     def solve(self) -> Solution:
         res1 = 0
         res2 = 0
-        for line in self.data.splitlines():
-            nums1 = []
-            nums2 = []
-            for i, c in enumerate(line):
-                if c.isdigit():
-                    nums1.append(c)
-                    nums2.append(c)
-
-                for n in self.NUMS:
-                    if line[i:].startswith(n):
-                        nums2.append(str(self.NUMS.index(n) + 1))
-            res1 += int(nums1[0] + nums1[-1])
-            res2 += int(nums2[0] + nums2[-1])
+        lines = self.source.lines()
+        while batch := list(itertools.islice(lines, BATCH)):
+            text = "\n".join(batch)
+            res1 += calibration_sum(text)
+            res2 += calibration_sum(text, words=True)
+
         yield res1
         yield res2
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
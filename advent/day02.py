@@ -1,38 +1,81 @@
 # /usr/bin/env python3
-import re
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
 
 from advent.base import BaseSolver, Solution
+from advent.reader import int_array
 
+if TYPE_CHECKING:
+    import numpy as np
 
-class Solver(BaseSolver):
-    def solve(self) -> Solution:
-        res1 = 0
-        res2 = 0
-        r, g, b = 12, 13, 14
-        for game in self.data.splitlines():
-            possible = True
-            minr, ming, minb = 0, 0, 0
-            game_str, rest = game.split(":")
-            game_id = int(game_str.split(" ")[1])
+# Rewrites a game as a flat stream of (value, code) pairs, which int_array can
+# parse in one go: (id, GAME) for the header, (count, colour) for each colour in
+# a draw and (0, END) between draws. "Game 4: 1 red, 2 blue; 3 green" becomes
+# "4 3 1 0 2 2 0 4 3 1".
+RED, GREEN, BLUE, GAME, END = range(5)
+REWRITES = [
+    ("Game ", ""),
+    (":", f" {GAME}"),
+    (",", ""),
+    (";", f" 0 {END}"),
+    (" red", f" {RED}"),
+    (" green", f" {GREEN}"),
+    (" blue", f" {BLUE}"),
+]
+BAG = (12, 13, 14)
+BATCH = 4096
+
+
+def parse_columns(text: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # (the id of each game, the game index of each draw, a draws x RGB table)
+    import numpy as np
+
+    for old, new in REWRITES:
+        text = text.replace(old, new)
+    values, codes = int_array(text).reshape(-1, 2).T
+    is_game = codes == GAME
+    # Each game header also starts that game's first draw
+    starts_draw = is_game | (codes == END)
+    draw = np.cumsum(starts_draw) - 1
+    draw_game = (np.cumsum(is_game) - 1)[starts_draw]
 
-            for s in rest.split(";"):
-                red = int((re.findall(r"(\d+) red", s) or [0])[0])
-                green = int((re.findall(r"(\d+) green", s) or [0])[0])
-                blue = int((re.findall(r"(\d+) blue", s) or [0])[0])
+    is_cube = codes < GAME
+    cubes = np.zeros((len(draw_game), 3), dtype=np.int64)
+    cubes[draw[is_cube], codes[is_cube]] = values[is_cube]
+    return values[is_game], draw_game, cubes
 
-                if red > r or green > g or blue > b:
-                    possible = False
 
-                minr = max(minr, red)
-                ming = max(ming, green)
-                minb = max(minb, blue)
+def game_maxima(draw_game: np.ndarray, cubes: np.ndarray) -> np.ndarray:
+    import numpy as np
 
-            if possible:
-                res1 += game_id
-            res2 += minr * ming * minb
+    # Draws are grouped by game already, so each game is one reduceat segment
+    starts = np.flatnonzero(np.diff(draw_game, prepend=-1))
+    return np.maximum.reduceat(cubes, starts, axis=0)
+
+
+class Solver(BaseSolver):
+    streaming = True
+
+    def solve(self) -> Solution:
+        import numpy as np
+
+        res1 = 0
+        res2 = 0
+        lines = self.source.lines()
+        while batch := list(itertools.islice(lines, BATCH)):
+            game_ids, draw_game, cubes = parse_columns("\n".join(batch))
+            if len(game_ids) == 0:
+                continue
+            maxima = game_maxima(draw_game, cubes)
+            possible = np.all(maxima <= np.array(BAG), axis=1)
+            res1 += int(game_ids[possible].sum())
+            res2 += int(maxima.prod(axis=1).sum())
 
         yield res1
         yield res2
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
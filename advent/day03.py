@@ -2,67 +2,44 @@
 
 from __future__ import annotations
 
-import pydantic
+import itertools
+import re
 
 from advent.base import BaseSolver, Solution
-from advent.graph import Point
+from advent.graph import ArrayGrid
 
-
-class Node(pydantic.BaseModel):
-    value: int
-    adj: list[Point]
+NUMBER_RE = re.compile(r"\d+")
 
 
 class Solver(BaseSolver):
     def solve(self) -> Solution:
-        points_of_interest = {}
-        nodes = []
+        import numpy as np
 
-        for r, line in enumerate(self.data.splitlines()):
-            in_number = False
-            cur = []
-            cur_adj = set()
-            for c, s in enumerate(line):
-                # First record the point of interest
-                if not s.isdigit() and s != ".":
-                    points_of_interest[Point(r, c)] = s
+        grid = ArrayGrid.from_lines(self.lines)
+        digits = np.char.isdigit(grid.a)
+        symbols = ~digits & ~grid.mask(".")
+        near_symbol = grid.count_neighbours(symbols, diagonal=True) > 0
 
-                # Then handle numbers
-                if s.isdigit():
-                    in_number = True
-                    cur.append(s)
-                    for point in Point(r, c).adjacent8():
-                        cur_adj.add(point)
-                elif in_number:
-                    nodes.append(Node(value=int("".join(cur)), adj=list(cur_adj)))
-                    cur = []
-                    cur_adj = set()
-                    in_number = False
-            if in_number:
-                nodes.append(Node(value=int("".join(cur)), adj=list(cur_adj)))
+        # Every digit is labelled with the index of the number it's part of, and
+        # everything else with -1
+        labels = np.full(grid.a.shape, -1, dtype=np.int64)
+        values: list[int] = []
+        for row, line in enumerate(self.lines):
+            for match in NUMBER_RE.finditer(line):
+                labels[row, match.start() : match.end()] = len(values)
+                values.append(int(match.group()))
 
-        # Now we go through all the nodes (numbers) and if they're adjacent to a
-        # point of interest, we add them to the result.
-        # For part2, we check if the PoI is a gear and if so either store it in our
-        # "gears" dict or multiply it by the previously stored node's value.
-        # This relies on each gear being adjacent to no more than two nodes.
-        res1 = 0
-        res2 = 0
-        gears: dict[Point, int] = {}
-        for node in nodes:
-            added = False
-            for adj in node.adj:
-                if adj in points_of_interest:
-                    if not added:
-                        res1 += node.value
-                        added = True
-                    if points_of_interest[adj] == "*":
-                        if adj in gears:
-                            res2 += node.value * gears[adj]
-                        gears[adj] = node.value
+        # A number is a part number if any of its digits touch a symbol
+        yield sum(values[i] for i in np.unique(labels[near_symbol & digits]).tolist())
 
-        yield res1
+        res2 = 0
+        for row, col in grid.find_all("*"):
+            window = labels[max(row - 1, 0) : row + 2, max(col - 1, 0) : col + 2]
+            # Real gears touch exactly two numbers, so pair them up in reading order
+            adjacent = np.unique(window[window >= 0]).tolist()
+            res2 += sum(values[a] * values[b] for a, b in itertools.pairwise(adjacent))
         yield res2
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -5,10 +5,12 @@ from advent.base import BaseSolver, Solution
 
 
 class Solver(BaseSolver):
+    streaming = True
+
     def solve(self) -> Solution:
         res1 = 0
         res2_d: dict[int, int] = collections.defaultdict(int)
-        for card_id, line in enumerate(self.data.splitlines(), start=1):
+        for card_id, line in enumerate(self.source.lines(), start=1):
             res2_d[card_id] += 1
             winners, mine = line.split(":")[1].split("|")
             power = len(set(winners.split()) & set(mine.split())) - 1
@@ -25,4 +27,5 @@ class Solver(BaseSolver):
         yield sum(res2_d.values())
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -1,13 +1,14 @@
 # /usr/bin/env python3
 
-import numpy as np
-
 from advent.base import BaseSolver, Solution
+from advent.reader import packed_ints
 
 
 # Inspired by the "WolframAlpha" solution:
 # https://old.reddit.com/r/adventofcode/comments/18bwe6t/2023_day_6_solutions/kc6wwxq/
 def solve_algebraically(time: int, dist: int) -> int:
+    import numpy as np
+
     roots = np.roots([1, -time, dist])
     bigger, smaller = max(roots), min(roots)
     res = int(bigger) - int(smaller)
@@ -19,8 +20,8 @@ def solve_algebraically(time: int, dist: int) -> int:
 
 class Solver(BaseSolver):
     def solve(self) -> Solution:
-        times = [int(x) for x in self.data.splitlines()[0].split(":")[1].split()]
-        dists = [int(x) for x in self.data.splitlines()[1].split(":")[1].split()]
+        times = packed_ints(self.data.splitlines()[0].split(":")[1])
+        dists = packed_ints(self.data.splitlines()[1].split(":")[1])
 
         res1 = 1
         for time, dist in zip(times, dists):
@@ -35,4 +36,5 @@ class Solver(BaseSolver):
         yield solve_algebraically(time, dist)
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
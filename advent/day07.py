@@ -71,9 +71,11 @@ class Hand(pydantic.BaseModel):
 
 
 class Solver(BaseSolver):
+    streaming = True
+
     def solve(self) -> Solution:
         hands = []
-        for line in self.data.splitlines():
+        for line in self.source.lines():
             hand_str, bid = line.split(" ")
             hands.append(Hand(hand=list(hand_str), bid=int(bid)))
 
@@ -91,4 +93,5 @@ class Solver(BaseSolver):
         yield res2
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
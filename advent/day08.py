@@ -55,4 +55,5 @@ class Solver(BaseSolver):
         yield math.lcm(*[tbl.zdist(node, last_only=True) for node in tbl.a_starts])
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
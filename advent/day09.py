@@ -1,31 +1,47 @@
 # /usr/bin/env python3
+import itertools
 
 from advent.base import BaseSolver, Solution
+from advent.reader import int_rows
+
+BATCH = 4096
+
+
+def extrapolate(histories: str) -> tuple[int, int]:
+    import numpy as np
+
+    # Every history has the same length, so all of them are differenced
+    # together as the rows of one array. Rows that reach all zeros early just
+    # carry on adding zeros.
+    diffs = int_rows(histories)
+    forwards = 0
+    backwards = 0
+    sign = 1
+    while diffs.shape[1] > 0:
+        forwards += int(diffs[:, -1].sum())
+        # Extrapolating backwards alternates the signs of the first values
+        backwards += sign * int(diffs[:, 0].sum())
+        sign = -sign
+        diffs = np.diff(diffs, axis=1)
+    return forwards, backwards
 
 
 class Solver(BaseSolver):
+    streaming = True
+
     def solve(self) -> Solution:
         res1 = 0
         res2 = 0
-        for line in self.data.splitlines():
-            vals = [int(x) for x in line.split()]
-
-            res1 += vals[-1]
-            remember = [vals[0]]
-
-            diffs = [vals[i + 1] - vals[i] for i in range(len(vals) - 1)]
-            while not all(d == 0 for d in diffs):
-                res1 += diffs[-1]
-                remember.append(diffs[0])
-                diffs = [diffs[i + 1] - diffs[i] for i in range(len(diffs) - 1)]
-
-            cur = 0
-            for value in reversed(remember):
-                cur = value - cur
-            res2 += cur
+        lines = self.source.lines()
+        # A batch of histories at a time, so memory use doesn't grow with the input
+        while batch := list(itertools.islice(lines, BATCH)):
+            forwards, backwards = extrapolate("\n".join(batch))
+            res1 += forwards
+            res2 += backwards
 
         yield res1
         yield res2
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
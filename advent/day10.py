@@ -7,9 +7,11 @@ import pydantic
 
 from advent.base import BaseSolver, Solution
 from advent.graph import Point
+from advent.records import record
 
 
-class Node(pydantic.BaseModel):
+@record
+class Node:
     p: Point
     val: str
 
@@ -235,4 +237,5 @@ class Solver(BaseSolver):
         yield g.part2()
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
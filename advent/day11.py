@@ -36,19 +36,15 @@ class GalaxyMap(pydantic.BaseModel):
 
 class Solver(BaseSolver):
     def solve(self) -> Solution:
-        galaxies = []
-        empty_rows = set()
-        empty_cols = set()
-        for row, line in enumerate(self.lines):
-            if all(c == "." for c in line):
-                empty_rows.add(row)
-            for col, char in enumerate(line):
-                if char == "#":
-                    galaxies.append(Point(row, col))
-
-        for col in range(len(self.lines[0])):
-            if all(line[col] == "." for line in self.lines):
-                empty_cols.add(col)
+        import numpy as np
+
+        grid = self.view.grid
+        galaxies = [
+            Point(int(row), int(col)) for row, col in np.argwhere(grid == ord("#"))
+        ]
+        empty = grid == ord(".")
+        empty_rows = set(np.flatnonzero(empty.all(axis=1)).tolist())
+        empty_cols = set(np.flatnonzero(empty.all(axis=0)).tolist())
 
         g = GalaxyMap(galaxies=galaxies, empty_rows=empty_rows, empty_cols=empty_cols)
 
@@ -56,4 +52,5 @@ class Solver(BaseSolver):
         yield sum(g.pairwise_dists(factor=1_000_000).values())
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
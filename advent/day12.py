@@ -1,8 +1,6 @@
 # /usr/bin/env python3
 
-import joblib
 import pydantic
-import tqdm
 
 from advent.base import BaseSolver, Solution
 
@@ -129,6 +127,9 @@ class ProblemLine(pydantic.BaseModel):
 
 class Solver(BaseSolver):
     def solve(self) -> Solution:
+        import joblib
+        import tqdm
+
         problems = []
         for line in self.lines:
             g, nums = line.split(" ")
@@ -153,4 +154,5 @@ class Solver(BaseSolver):
         )
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
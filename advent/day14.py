@@ -1,88 +1,86 @@
 # /usr/bin/env python3
 from __future__ import annotations
 
-import pydantic
-import tqdm
+from typing import TYPE_CHECKING
 
 from advent.base import BaseSolver, Solution
-
-TARGET = 1000000000 - 1
-
-
-class Grid(pydantic.BaseModel):
-    g: list[str]
-
-    @property
-    def T(self) -> Grid:
-        return Grid(g=["".join(x) for x in zip(*self.g)])
-
-    @property
-    def Tinv(self) -> Grid:
-        return Grid(g=["".join(x) for x in zip(*self.g[::-1])])
-
-    def tilt(self) -> Grid:
-        g2 = self.T
-        out = []
-        for row in g2.g:
-            next_left_idx = 0
-            next_row: list[str] = []
-            for j, char in enumerate(row):
-                if char == "#":
-                    next_left_idx = j + 1
-                    while len(next_row) < j:
-                        next_row.append(".")
-                    next_row.append("#")
-                elif char == "O":
-                    next_row.append("O")
-                    next_left_idx += 1
-            while len(next_row) < len(row):
-                next_row.append(".")
-            out.append("".join(next_row))
-        return Grid(g=out).T
+from advent.graph.bitgrid import BitGrid
+
+if TYPE_CHECKING:
+    import numpy as np
+
+TARGET = 1000000000
+
+
+def slide(
+    rows: list[int], runs: list[list[tuple[int, int]]], toward_low: bool
+) -> list[int]:
+    # Rocks pile up at one end of each gap between walls, so only how many there
+    # are in each gap matters
+    out = []
+    for row, row_runs in zip(rows, runs):
+        new = 0
+        for lo, hi in row_runs:
+            n = (row & ((1 << hi) - (1 << lo))).bit_count()
+            if n:
+                new |= ((1 << n) - 1) << (lo if toward_low else hi - n)
+        out.append(new)
+    return out
+
+
+class Platform:
+    def __init__(self, grid: np.ndarray) -> None:
+        walls = BitGrid.from_array(grid == ord("#"))
+        self.row_runs = (~walls).runs()
+        self.col_runs = (~walls.T).runs()
+        self.rocks = BitGrid.from_array(grid == ord("O"))
+
+    def tilt_north(self) -> None:
+        cols = slide(self.rocks.cols, self.col_runs, toward_low=True)
+        self.rocks = BitGrid(cols, self.rocks.height).T
+
+    def spin(self) -> None:
+        # North, west, south then east, switching between columns and rows so
+        # that each tilt slides bits along an int
+        height, width = self.rocks.height, self.rocks.width
+        cols = slide(self.rocks.cols, self.col_runs, toward_low=True)
+        rows = BitGrid(cols, height).cols
+        rows = slide(rows, self.row_runs, toward_low=True)
+        cols = BitGrid(rows, width).cols
+        cols = slide(cols, self.col_runs, toward_low=False)
+        rows = BitGrid(cols, height).cols
+        self.rocks = BitGrid(slide(rows, self.row_runs, toward_low=False), width)
 
     def load(self) -> int:
-        res = 0
-        for i, row in enumerate(self.g):
-            for char in row:
-                if char == "O":
-                    res += len(self.g) - i
-        return res
+        height = self.rocks.height
+        return sum(
+            row.bit_count() * (height - i) for i, row in enumerate(self.rocks.rows)
+        )
 
     def display(self) -> None:
-        for row in self.g:
+        for row in self.rocks.to_lines(on="O"):
             print(row)
 
 
 class Solver(BaseSolver):
     def solve(self) -> Solution:
-        grid = Grid(g=self.lines)
-        grid = grid.tilt()
-        yield grid.load()
+        platform = Platform(self.view.grid)
+        platform.tilt_north()
+        yield platform.load()
 
+        # The rock layout is hashable, so spin until one repeats exactly
+        platform = Platform(self.view.grid)
+        seen: dict[BitGrid, int] = {}
         loads: list[int] = []
-        last_load = -1
-        load = -1
-        min_loads = 1_000
-        self.logger.info("Progress bar shows estimate...")
-        for _ in tqdm.tqdm(range(TARGET), total=int(min_loads * 1.05)):
-            last_load = load
-            # Do 4 tilts
-            for _ in range(4):
-                grid = grid.tilt()
-                grid = grid.Tinv
-                load = grid.load()
-            if (
-                len(loads) > min_loads
-                and load == loads[min_loads]
-                and last_load == loads[min_loads - 1]
-            ):
-                loads = loads[min_loads:]
-                break
-            loads.append(load)
-
-        # Find the cycle index corresponding to the last load
-        self.logger.info(f"Found cycle length of {len(loads)}")
-        yield loads[(TARGET - min_loads) % len(loads)]
-
-
-Solver.run()
+        while platform.rocks not in seen:
+            seen[platform.rocks] = len(loads)
+            loads.append(platform.load())
+            platform.spin()
+
+        start = seen[platform.rocks]
+        self.logger.info(f"Found cycle length of {len(loads) - start}")
+        yield loads[start + (TARGET - start) % (len(loads) - start)]
+
+
+if __name__ == "__main__":
+    Solver.run()
@@ -35,10 +35,12 @@ class LensSet:
 
 
 class Solver(BaseSolver):
+    streaming = True
+
     def solve(self) -> Solution:
         res1 = 0
         ls = LensSet()
-        for code in self.data.strip().split(","):
+        for code in self.source.tokens(","):
             ls.apply(code)
             res1 += ls.hash(code)
         yield res1
@@ -79,4 +81,5 @@ class GolfedSolver(BaseSolver):
 """  # noqa
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
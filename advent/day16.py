@@ -1,86 +1,109 @@
 # /usr/bin/env python3
+from __future__ import annotations
 
-import collections
-
-import joblib
-import pydantic
-import tqdm
+from typing import TYPE_CHECKING
 
 from advent.base import BaseSolver, Solution
-from advent.graph import Direction, Point
+from advent.graph import CARDINAL, OFFSETS4, Direction, Point
+from advent.graph.statespace import Visited
+
+if TYPE_CHECKING:
+    import numpy as np
 
 Beam = tuple[Point, Direction]
 
 
-class Grid(pydantic.BaseModel):
-    g: list[str]
+# Every beam direction, indexed the same way as OFFSETS4
+DIRECTIONS = list(CARDINAL)
+
+
+def deflect(deflector: str, cur_dir: Direction) -> list[Direction]:
+    match deflector, cur_dir:
+        case "/", Direction.LEFT | Direction.RIGHT:
+            return [cur_dir.counter_clockwise]
+        case "/", Direction.UP | Direction.DOWN:
+            return [cur_dir.clockwise]
+        case "\\", Direction.LEFT | Direction.RIGHT:
+            return [cur_dir.clockwise]
+        case "\\", Direction.UP | Direction.DOWN:
+            return [cur_dir.counter_clockwise]
+        case "|", Direction.LEFT | Direction.RIGHT:
+            return [Direction.UP, Direction.DOWN]
+        case "-", Direction.UP | Direction.DOWN:
+            return [Direction.LEFT, Direction.RIGHT]
+        case _:
+            return [cur_dir]
+
+
+# For each tile byte, the outgoing direction indices for each incoming direction
+# index
+TRANSITIONS = {
+    ord(tile): [[DIRECTIONS.index(d2) for d2 in deflect(tile, d)] for d in DIRECTIONS]
+    for tile in "./\\|-"
+}
+
+
+class Grid:
+    def __init__(self, tiles: np.ndarray) -> None:
+        self.rows, self.cols = tiles.shape
+        # Flattened so that position row * cols + col is just an index
+        self.cells = tiles.tobytes()
 
     def inbounds(self, p: Point) -> bool:
-        return 0 <= p.row < len(self.g) and 0 <= p.col < len(self.g[0])
-
-    def calculate_energized(
-        self, starting_transition: Beam | None = None
-    ) -> set[Point]:
-        if starting_transition is None:
-            starting_transition = (Point(0, 0), Direction.RIGHT)
-
-        q: collections.deque[Beam] = collections.deque([starting_transition])
-        visited: set[Beam] = {q[0]}
-
-        while q:
-            cur_point, cur_dir = q.popleft()
-            for transition in self.next_dirs(cur_point, cur_dir):
-                if transition in visited or not self.inbounds(transition[0]):
-                    continue
-                visited.add(transition)
-                q.append(transition)
-        return {p for p, _ in visited}
-
-    def next_dirs(self, cur_point: Point, cur_dir: Direction) -> list[Beam]:
-        deflector = self.g[cur_point.row][cur_point.col]
-        dirs = []
-        match deflector, cur_dir:
-            case "/", Direction.LEFT | Direction.RIGHT:
-                dirs = [cur_dir.counter_clockwise]
-            case "/", Direction.UP | Direction.DOWN:
-                dirs = [cur_dir.clockwise]
-            case "\\", Direction.LEFT | Direction.RIGHT:
-                dirs = [cur_dir.clockwise]
-            case "\\", Direction.UP | Direction.DOWN:
-                dirs = [cur_dir.counter_clockwise]
-            case "|", Direction.LEFT | Direction.RIGHT:
-                dirs = [Direction.UP, Direction.DOWN]
-            case "-", Direction.UP | Direction.DOWN:
-                dirs = [Direction.LEFT, Direction.RIGHT]
-            case _:
-                dirs = [cur_dir]
-        return [(cur_point.move(d), d) for d in dirs]
+        return 0 <= p.row < self.rows and 0 <= p.col < self.cols
+
+    def visited_store(self) -> Visited:
+        return Visited(self.rows * self.cols, len(DIRECTIONS))
+
+    def energized(self, start: Beam, visited: Visited) -> int:
+        # States are (row * cols + col, direction index), tracked in a Visited that
+        # callers can reuse between starts
+        rows, cols = self.rows, self.cols
+        cells = self.cells
+        p, heading = start
+        d = DIRECTIONS.index(heading)
+        visited.clear()
+        visited.add(p.row * cols + p.col, d)
+        stack = [(p.row, p.col, d)]
+        while stack:
+            row, col, d = stack.pop()
+            for d2 in TRANSITIONS[cells[row * cols + col]][d]:
+                dr, dc = OFFSETS4[d2]
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols and visited.add(r * cols + c, d2):
+                    stack.append((r, c, d2))
+        return visited.count_positions()
 
     def starting_transitions(self) -> list[Beam]:
-        rows = len(self.g)
-        cols = len(self.g[0])
+        rows = self.rows
+        cols = self.cols
         res = []
         # Along the top
         res += [(Point(0, yy), Direction.DOWN) for yy in range(cols)]
         # Along the bottom
-        res += [(Point(len(self.g) - 1, yy), Direction.UP) for yy in range(cols)]
+        res += [(Point(rows - 1, yy), Direction.UP) for yy in range(cols)]
         # Along the left side
         res += [(Point(xx, 0), Direction.RIGHT) for xx in range(rows)]
         # Along the right side
-        res += [(Point(xx, len(self.g[0]) - 1), Direction.LEFT) for xx in range(rows)]
+        res += [(Point(xx, cols - 1), Direction.LEFT) for xx in range(rows)]
         return res
 
 
 class Solver(BaseSolver):
     def solve(self) -> Solution:
-        grid = Grid(g=self.lines)
-        yield len(grid.calculate_energized())
+        import tqdm
+
+        grid = Grid(self.view.grid)
+        visited = grid.visited_store()
+        yield grid.energized((Point(0, 0), Direction.RIGHT), visited)
 
-        results: list[set[Point]] = joblib.Parallel(n_jobs=-1)(
-            joblib.delayed(grid.calculate_energized)(pos)
-            for pos in tqdm.tqdm(grid.starting_transitions())
-        )  # type: ignore
-        yield max(len(r) for r in results)
+        # One visited buffer, cleared between starts, rather than a fresh set of
+        # tuples for each of them
+        yield max(
+            grid.energized(start, visited)
+            for start in tqdm.tqdm(grid.starting_transitions())
+        )
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -1,16 +1,18 @@
 # /usr/bin/env python3
 from __future__ import annotations
 
-import heapq
-
 import pydantic
 
 from advent.base import BaseSolver, Solution
 from advent.colors import gray, green, yellow
-from advent.graph import Direction, Point
+from advent.graph import Direction, Point, search
+from advent.records import record
+
+HEADINGS: dict[tuple[int, int], Direction] = {(d.drow, d.dcol): d for d in Direction}
 
 
-class State(pydantic.BaseModel):
+@record
+class State:
     cost: int
     p: Point
     heading: Direction
@@ -58,24 +60,17 @@ class Grid(pydantic.BaseModel):
                         best[neighbor] = new_cost
         return best
 
-    def print_path(self, prev: dict[State, State | None], final_state: State) -> None:
-        res = []
-        res_points = {}
-        cur: State | None = final_state
-        while cur is not None:
-            res.append(cur)
-            res_points[cur.p] = cur
-            cur = prev[cur]
-        print(" => ".join(f"({s.p.row}, {s.p.col})" for s in reversed(res)))
-        i = 1
+    def print_path(self, path: list[tuple[Point, Direction]]) -> None:
+        print(" => ".join(f"({p.row}, {p.col})" for p, _ in path))
+        headings = dict(path)
+        final = path[-1][0]
         for row in range(self.rows):
             for col in range(self.cols):
                 p = Point(row, col)
-                if p == final_state.p:
+                if p == final:
                     print(green("O"), end="")
-                elif p in res_points:
-                    print(yellow(res[-i - 1].heading.ascii()), end="")
-                    i += 1
+                elif p in headings:
+                    print(yellow(headings[p].ascii()), end="")
                 else:
                     print(gray(str(self.at(p))), end="")
             print()
@@ -93,45 +88,52 @@ class Grid(pydantic.BaseModel):
     def search_3(self, ultra: bool = False) -> int:
         min_sequential = 4 if ultra else 1
         max_sequential = 10 if ultra else 3
-        p = Point(0, 0)
-        target = Point(self.rows - 1, self.cols - 1)
-        # We want to initially be able to turn either down or right into the grid.
-        # Since we encode the current heading instead of "valid turns", we create these
-        # two different starts since the first will allow us to turn right, and the
-        # second will allow us to turn down. It's definitely possible to clean this up,
-        # but after spending so much time here, it's good enough.
-        start = State(cost=0, p=p, heading=Direction.DOWN, sequential=1)
-        start2 = State(cost=0, p=p, heading=Direction.RIGHT, sequential=1)
-        heap = [start, start2]
-        visited = set()
-        prev: dict[State, State | None] = {start: None, start2: None}
-
-        while len(heap) > 0:
-            state = heapq.heappop(heap)
-            if state.p == target:
-                self.print_path(prev, state)
-                return state.cost
-            elif (state.p, state.heading) in visited:
-                continue
-
-            visited.add((state.p, state.heading))
-
-            for d2 in [state.heading.turn_left(), state.heading.turn_right()]:
-                # Move [min, max] spaces in that direction now
-                next_pos = state.p
-                cur_cost = state.cost
+        rows, cols, g = self.rows, self.cols, self.g
+        # A state is a position plus whether we got there moving vertically, packed
+        # as (row * cols + col) * 2 + vertical. We always turn after a run, so from
+        # a vertical state we can only move horizontally and vice versa. Starting
+        # in both states at (0, 0) lets us head either right or down first.
+        steps = (((0, 1), (0, -1)), ((1, 0), (-1, 0)))
+
+        def neighbours(state: int) -> list[tuple[int, int]]:
+            pos, vertical = divmod(state, 2)
+            row, col = divmod(pos, cols)
+            res = []
+            for dr, dc in steps[1 - vertical]:
+                r, c, cost = row, col, 0
                 for seq in range(1, max_sequential + 1):
-                    next_pos = next_pos.move(d2)
-                    if self.inbounds(next_pos):
-                        cur_cost += self.at(next_pos)
-                        if seq >= min_sequential:
-                            new_state = State(
-                                cost=cur_cost, p=next_pos, heading=d2, sequential=seq
-                            )
-                            prev[new_state] = state
-                            heapq.heappush(heap, new_state)
-
-        return -1
+                    r += dr
+                    c += dc
+                    if not (0 <= r < rows and 0 <= c < cols):
+                        break
+                    cost += g[r][c]
+                    if seq >= min_sequential:
+                        res.append(((r * cols + c) * 2 + 1 - vertical, cost))
+            return res
+
+        target = rows * cols - 1
+        result = search.dijkstra(
+            rows * cols * 2,
+            [0, 1],
+            neighbours,
+            goal=lambda state: state // 2 == target,
+            parents=True,
+        )
+        if result.goal is None:
+            return -1
+
+        path = []
+        prev = None
+        for state in result.path(result.goal):
+            p = Point(*divmod(state // 2, cols))
+            heading = Direction.RIGHT
+            if prev is not None:
+                dr, dc = p.row - prev.row, p.col - prev.col
+                heading = HEADINGS[(dr and dr // abs(dr), dc and dc // abs(dc))]
+            path.append((p, heading))
+            prev = p
+        self.print_path(path)
+        return result.dist[result.goal]
 
     def search_dfs(self, ultra: bool = False) -> int:
         p = Point(0, 0)
@@ -193,7 +195,12 @@ class Grid(pydantic.BaseModel):
                     visited.add(s)
                     stack.append(s)
 
-        self.print_path(prev, best_state)
+        path = []
+        cur: State | None = best_state
+        while cur is not None:
+            path.append((cur.p, cur.heading))
+            cur = prev[cur]
+        self.print_path(path[::-1])
         return res
 
 
@@ -204,4 +211,5 @@ class Solver(BaseSolver):
         yield g.search_3(ultra=True)
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -6,96 +6,66 @@ import re
 import pydantic
 
 from advent.base import BaseSolver, Solution
+from advent.intervals import Box
 
+AXES = "xmas"
 
-class RatingRange(pydantic.BaseModel):
-    x: tuple[int, int]
-    m: tuple[int, int]
-    a: tuple[int, int]
-    s: tuple[int, int]
 
-    def part1_score(self) -> int:
-        return self.x[0] + self.m[0] + self.a[0] + self.s[0]
-
-    def part2_score(self) -> int:
-        x = int(self.x[1] - self.x[0])
-        m = int(self.m[1] - self.m[0])
-        a = int(self.a[1] - self.a[0])
-        s = int(self.s[1] - self.s[0])
-        return x * m * a * s
-
-    def for_key(self, key: str) -> tuple[int, int]:
-        return getattr(self, key)
-
-    def with_updated_key(self, key: str, value: tuple[int, int]) -> RatingRange:
-        return RatingRange(**{**self.dict(), key: value})
-
-    @classmethod
-    def from_str(cls, s: str) -> RatingRange:
-        # {x=787,m=2655,a=1222,s=2876}
-        match = re.match(r"{x=(\d+),m=(\d+),a=(\d+),s=(\d+)}", s)
-        assert match is not None
-        x, m, a, s = match.groups()
-        return cls(
-            x=(int(x), int(x) + 1),
-            m=(int(m), int(m) + 1),
-            a=(int(a), int(a) + 1),
-            s=(int(s), int(s) + 1),
-        )
+def parse_rating(s: str) -> Box:
+    # {x=787,m=2655,a=1222,s=2876}
+    match = re.match(r"{x=(\d+),m=(\d+),a=(\d+),s=(\d+)}", s)
+    assert match is not None
+    return Box.point(int(x) for x in match.groups())
 
 
 class Rule(pydantic.BaseModel):
     next_state: str
-    cond_key: str | None
-    interval: tuple[int | float, int | float]
+    axis: int | None = None
+    threshold: int = 0
+    # Whether the values below threshold pass, rather than those at or above it
+    below: bool = True
 
     @classmethod
     def from_str(cls, s: str) -> Rule:
         # a<2006:qkq
-        interval = (-float("inf"), float("inf"))
         if ":" not in s:
-            return cls(next_state=s, cond_key=None, interval=interval)
+            return cls(next_state=s)
         condition_str, next_state = s.split(":")
         if "<" in condition_str:
-            cond_key, interval_str = condition_str.split("<")
-            interval = (-float("inf"), int(interval_str))
+            cond_key, threshold_str = condition_str.split("<")
+            threshold, below = int(threshold_str), True
         else:
-            cond_key, interval_str = condition_str.split(">")
-            interval = (int(interval_str) + 1, float("inf"))
-        return cls(next_state=next_state, cond_key=cond_key, interval=interval)
+            cond_key, threshold_str = condition_str.split(">")
+            threshold, below = int(threshold_str) + 1, False
+        return cls(
+            next_state=next_state,
+            axis=AXES.index(cond_key),
+            threshold=threshold,
+            below=below,
+        )
+
+    def split(self, box: Box) -> tuple[Box | None, Box | None]:
+        # (the part that passes, the part left for the next rule)
+        if self.axis is None:
+            return box, None
+        lower, upper = box.split(self.axis, self.threshold)
+        return (lower, upper) if self.below else (upper, lower)
 
 
 class Workflow(pydantic.BaseModel):
     name: str
     rules: list[Rule]
 
-    def evaluate(self, r: RatingRange) -> list[tuple[str, RatingRange]]:
+    def evaluate(self, box: Box) -> list[tuple[str, Box]]:
         res = []
+        rest: Box | None = box
         for rule in self.rules:
-            if rule.cond_key is None:
-                # Everything passes
-                res.append((rule.next_state, r))
-                return res
-            else:
-                lo, hi = r.for_key(rule.cond_key)
-                intersection_start = int(max(lo, rule.interval[0]))
-                intersection_end = int(min(hi, rule.interval[1]))
-                if intersection_start < intersection_end:
-                    res.append(
-                        (
-                            rule.next_state,
-                            r.with_updated_key(
-                                rule.cond_key, (intersection_start, intersection_end)
-                            ),
-                        )
-                    )
-                    if lo < rule.interval[0]:
-                        r = r.with_updated_key(rule.cond_key, (lo, intersection_start))
-                    elif rule.interval[1] < hi:
-                        r = r.with_updated_key(rule.cond_key, (intersection_end, hi))
-                    else:
-                        # Full intersection, nothing else to do
-                        return res
+            assert rest is not None
+            passed, rest = rule.split(rest)
+            if passed is not None:
+                res.append((rule.next_state, passed))
+            if rest is None:
+                break
         return res
 
     @classmethod
@@ -115,7 +85,7 @@ class Solver(BaseSolver):
         for w_str in workflow_str.split("\n"):
             w = Workflow.from_str(w_str)
             workflows[w.name] = w
-        ratings = [RatingRange.from_str(r) for r in rating_str.split("\n")]
+        ratings = [parse_rating(r) for r in rating_str.split("\n")]
 
         res1 = 0
         for rating in ratings:
@@ -125,12 +95,12 @@ class Solver(BaseSolver):
                 next_states = workflows[node].evaluate(cur_range)
                 for (next_node, next_range) in next_states:
                     if next_node == "A":
-                        res1 += next_range.part1_score()
+                        res1 += sum(next_range.lo)
                     elif next_node != "R":
                         to_check.append((next_node, next_range))
         yield res1
 
-        start = RatingRange(x=(1, 4001), m=(1, 4001), a=(1, 4001), s=(1, 4001))
+        start = Box.cube(len(AXES), 1, 4001)
         to_check = [("in", start)]
         res2 = 0
         while len(to_check) > 0:
@@ -138,10 +108,11 @@ class Solver(BaseSolver):
             next_states = workflows[node].evaluate(cur_range)
             for (next_node, next_range) in next_states:
                 if next_node == "A":
-                    res2 += next_range.part2_score()
+                    res2 += next_range.volume()
                 elif next_node != "R":
                     to_check.append((next_node, next_range))
         yield res2
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
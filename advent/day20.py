@@ -120,4 +120,5 @@ class Solver(BaseSolver):
         yield self.broadcast(self.parse(), target="th")
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -114,4 +114,5 @@ class Solver(BaseSolver):
         yield total
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -8,22 +8,17 @@ class Solver(BaseSolver):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.logger.info("Precomputing graph edges")
-        self.g = [[c for c in line] for line in self.lines]
+        grid = self.view.grid
+        self.rows, self.cols = grid.shape
+        # Flattened so that (row, col) is at row * cols + col
+        self.cells = grid.tobytes()
         self.g_short_part1 = self.simplify_graph(part2=False)
         self.g_short_part2 = self.simplify_graph(part2=True)
         self.logger.info("Done precomputing graph edges")
 
-    @property
-    def rows(self) -> int:
-        return len(self.g)
-
-    @property
-    def cols(self) -> int:
-        return len(self.g[0])
-
     def at(self, p: Point) -> str:
         if 0 <= p.row < self.rows and 0 <= p.col < self.cols:
-            return self.g[p.row][p.col]
+            return chr(self.cells[p.row * self.cols + p.col])
         return "#"
 
     def valid_adj(self, p: Point, part2: bool = False) -> list[Point]:
@@ -144,4 +139,5 @@ class Solver(BaseSolver):
         yield self.dfs(part2=True)
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -3,9 +3,8 @@ from __future__ import annotations
 
 import dataclasses
 
-import z3
-
 from advent.base import BaseSolver, Solution
+from advent.reader import int_rows
 
 
 @dataclasses.dataclass
@@ -73,7 +72,11 @@ class Line2D:
 
 class Solver(BaseSolver):
     def solve(self) -> Solution:
-        lines = [Line2D.from_str(line) for line in self.lines]
+        import z3
+
+        # tolist gives back Python ints, which can't overflow in the products below
+        stones = int_rows(self.data, sep=",@").tolist()
+        lines = [Line2D.from_point3d(Point3D(*stone)) for stone in stones]
         loxy = 7 if self.is_example else 200_000_000_000_000
         hixy = 27 if self.is_example else 400_000_000_000_000
 
@@ -111,4 +114,5 @@ class Solver(BaseSolver):
         yield int(str(res))
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import collections
+import copy
 from dataclasses import dataclass
 
-import tqdm
-
 from advent.base import BaseSolver, Solution
 
 
@@ -48,6 +47,8 @@ class Solver(BaseSolver):
         return components
 
     def get_split(self, g: dict[str, set[str]]) -> WireSolution:
+        import tqdm
+
         all_pairs = set()
         for comp in self.g:
             for other in self.g[comp]:
@@ -96,4 +97,5 @@ class Solver(BaseSolver):
         yield None
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()
@@ -0,0 +1,648 @@
+# Synthetic inputs for stress testing the solvers beyond the size of the real
+# puzzle inputs. Every generator takes a scale (1 is roughly the size of a real
+# input) and a seeded RNG, and produces input in the same format as the puzzle.
+# Where a solver relies on structure that real inputs happen to have (day 8's
+# cycles, day 20's counters, day 25's cut, ...) the generator builds that
+# structure in too, so the answers stay meaningful rather than just parseable.
+from __future__ import annotations
+
+import math
+import random
+import string
+from typing import Callable
+
+Generator = Callable[[int, random.Random], str]
+
+NUM_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(day: int, scale: int = 1, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+    return GENERATORS[day](scale, random.Random(seed))
+
+
+def side(base: int, scale: int) -> int:
+    # Grid inputs grow in area rather than side length
+    return max(2, round(base * math.sqrt(scale)))
+
+
+def names(
+    rng: random.Random,
+    count: int,
+    alphabet: str = string.ascii_lowercase,
+    length: int | None = None,
+    exclude: set[str] | None = None,
+) -> list[str]:
+    exclude = exclude or set()
+    if length is None:
+        length = 2
+        while len(alphabet) ** length < 2 * (count + len(exclude)):
+            length += 1
+    res: set[str] = set()
+    while len(res) < count:
+        name = "".join(rng.choices(alphabet, k=length))
+        if name not in exclude:
+            res.add(name)
+    return sorted(res)
+
+
+def tree_loop(
+    rng: random.Random, h: int, w: int, stretch: int = 1
+) -> list[tuple[int, int]]:
+    # A simple closed loop on the lattice: the outline of a random spanning tree
+    # over h x w cells. The tree is drawn at double resolution (cells at even
+    # coordinates, tree edges filling the gaps between them) which guarantees
+    # the outline never touches itself. Stretching the loop leaves room for
+    # points inside it.
+    occupied = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + dr, c + dc)
+            for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0))
+            if 0 <= r + dr < h
+            and 0 <= c + dc < w
+            and (2 * (r + dr), 2 * (c + dc)) not in occupied
+        ]
+        if not options:
+            stack.pop()
+            continue
+        r2, c2 = rng.choice(options)
+        occupied.add((r + r2, c + c2))
+        occupied.add((2 * r2, 2 * c2))
+        stack.append((r2, c2))
+
+    # Walk the boundary of the union of those cells clockwise. Cell (r, c) is the
+    # unit square with corners (r, c) and (r + 1, c + 1).
+    nxt = {}
+    for r, c in occupied:
+        if (r - 1, c) not in occupied:
+            nxt[(r, c)] = (r, c + 1)
+        if (r, c + 1) not in occupied:
+            nxt[(r, c + 1)] = (r + 1, c + 1)
+        if (r + 1, c) not in occupied:
+            nxt[(r + 1, c + 1)] = (r + 1, c)
+        if (r, c - 1) not in occupied:
+            nxt[(r + 1, c)] = (r, c)
+    start = min(nxt)
+    loop = [start]
+    while (p := nxt[loop[-1]]) != start:
+        loop.append(p)
+    assert len(loop) == len(nxt)
+
+    res = []
+    for (r1, c1), (r2, c2) in zip(loop, loop[1:] + loop[:1]):
+        for k in range(stretch):
+            res.append((r1 * stretch + (r2 - r1) * k, c1 * stretch + (c2 - c1) * k))
+    return res
+
+
+def day01(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        parts = []
+        for _ in range(rng.randint(3, 10)):
+            match rng.random():
+                case x if x < 0.3:
+                    parts.append(rng.choice(string.digits[1:]))
+                case x if x < 0.6:
+                    parts.append(rng.choice(NUM_WORDS))
+                case _:
+                    parts.append("".join(rng.choices(string.ascii_lowercase, k=3)))
+        # Part 1 needs at least one real digit on every line
+        parts.insert(rng.randint(0, len(parts)), rng.choice(string.digits[1:]))
+        lines.append("".join(parts))
+    return "\n".join(lines)
+
+
+def day02(scale: int, rng: random.Random) -> str:
+    lines = []
+    for game_id in range(1, 100 * scale + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {game_id}: {'; '.join(draws)}")
+    return "\n".join(lines)
+
+
+def day03(scale: int, rng: random.Random) -> str:
+    n = side(140, scale)
+    lines = []
+    for _ in range(n):
+        row: list[str] = []
+        while len(row) < n:
+            match rng.random():
+                case x if x < 0.08:
+                    digits = str(rng.randint(1, 999))[: n - len(row)]
+                    row.extend(digits)
+                    row.append(".")
+                case x if x < 0.11:
+                    row.append(rng.choice("*#+$/=@%&-"))
+                case _:
+                    row.append(".")
+        lines.append("".join(row[:n]))
+    return "\n".join(lines)
+
+
+def day04(scale: int, rng: random.Random) -> str:
+    n = 200 * scale
+    lines = []
+    for card_id in range(1, n + 1):
+        # Most cards win little or nothing, and cards never win copies of cards
+        # past the end of the table
+        matches = min(rng.choice([0, 0, 0, 0, 1, 2, 3, 4, 5, 10]), n - card_id)
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        winners = numbers[:10]
+        mine = winners[:matches] + numbers[10:]
+        rng.shuffle(mine)
+        lines.append(
+            f"Card {card_id:>4}: "
+            + " ".join(f"{x:>2}" for x in winners)
+            + " | "
+            + " ".join(f"{x:>2}" for x in mine)
+        )
+    return "\n".join(lines)
+
+
+def day05(scale: int, rng: random.Random) -> str:
+    limit = 2**32
+    seeds = []
+    for _ in range(10 * scale):
+        length = rng.randint(1, 2**28)
+        seeds += [rng.randrange(limit - length), length]
+    lines = ["seeds: " + " ".join(str(x) for x in seeds), ""]
+
+    stages = ["seed", "soil", "fertilizer", "water", "light", "temperature"]
+    stages += ["humidity", "location"]
+    for src_name, dst_name in zip(stages, stages[1:]):
+        # Each map is a permutation of a random partition of [0, 2^32)
+        cuts = sorted(rng.sample(range(1, limit), 30 * scale))
+        ranges = list(zip([0] + cuts, cuts + [limit]))
+        shuffled = ranges[:]
+        rng.shuffle(shuffled)
+        dest = 0
+        entries = []
+        for lo, hi in shuffled:
+            entries.append(f"{dest} {lo} {hi - lo}")
+            dest += hi - lo
+        rng.shuffle(entries)
+        lines += [f"{src_name}-to-{dst_name} map:", *entries, ""]
+    return "\n".join(lines[:-1])
+
+
+def day06(scale: int, rng: random.Random) -> str:
+    # Part 2 glues every race together into one number, so anything past scale 1
+    # is really only a stress test for part 1.
+    times = [rng.randint(40, 99) for _ in range(4 * scale)]
+    dists = [rng.randint(t, t * t // 4 - 1) for t in times]
+    return (
+        "Time:     "
+        + " ".join(f"{t:>4}" for t in times)
+        + "\n"
+        + ("Distance: " + " ".join(f"{d:>4}" for d in dists))
+    )
+
+
+def day07(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        hand = "".join(rng.choices("23456789TJQKA", k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(lines)
+
+
+def day08(scale: int, rng: random.Random) -> str:
+    # Each ghost walks a chain of cycle * len(instructions) nodes from its A node
+    # to its Z node, and the Z node leads back to the start of the chain, so the
+    # distance to Z is also the cycle length (which is what part 2 assumes). The
+    # branch that the instructions don't take points somewhere random.
+    instructions = "".join(rng.choices("LR", k=rng.choice([47, 53, 59, 61])))
+    primes = [p for p in range(3, 3 + 20 * scale) if all(p % d for d in range(2, p))]
+    cycles = rng.sample(primes, 6)
+
+    body = string.ascii_uppercase[1:-1]
+    chain_names = iter(names(rng, len(instructions) * sum(cycles), alphabet=body))
+    ghosts = ["AA"] + names(rng, 5, alphabet=body, length=2, exclude={"AA", "ZZ"})
+    transitions = {}
+    all_nodes: list[str] = []
+    for ghost, cycle in zip(ghosts, cycles):
+        length = cycle * len(instructions)
+        chain = [f"{ghost}A"] + [next(chain_names) for _ in range(length - 1)]
+        chain.append("ZZZ" if ghost == "AA" else f"{ghost}Z")
+        all_nodes += chain
+        for j, node in enumerate(chain):
+            # The Z node behaves exactly like the A node
+            follow = chain[j + 1] if j < length else chain[1]
+            transitions[node] = (follow, instructions[j % len(instructions)])
+
+    lines = []
+    for node, (follow, action) in transitions.items():
+        decoy = rng.choice(all_nodes)
+        left, right = (follow, decoy) if action == "L" else (decoy, follow)
+        lines.append(f"{node} = ({left}, {right})")
+    rng.shuffle(lines)
+    return "\n".join([instructions, ""] + lines)
+
+
+def day09(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(200 * scale):
+        # Sums of binomials with integer coefficients always hit an all-zero row
+        coefs = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        vals = [
+            sum(c * math.comb(x, k) for k, c in enumerate(coefs)) for x in range(21)
+        ]
+        lines.append(" ".join(str(v) for v in vals))
+    return "\n".join(lines)
+
+
+def day10(scale: int, rng: random.Random) -> str:
+    n = side(35, scale)
+    loop = tree_loop(rng, n, n, stretch=2)
+    pipes = {
+        frozenset("UD"): "|",
+        frozenset("LR"): "-",
+        frozenset("UR"): "L",
+        frozenset("UL"): "J",
+        frozenset("DL"): "7",
+        frozenset("DR"): "F",
+    }
+
+    def direction(a: tuple[int, int], b: tuple[int, int]) -> str:
+        return {(-1, 0): "U", (1, 0): "D", (0, -1): "L", (0, 1): "R"}[
+            (b[0] - a[0], b[1] - a[1])
+        ]
+
+    size = 2 * (2 * n - 1) + 1
+    grid = [rng.choices(".|-LJ7F", k=size) for _ in range(size)]
+    for i, p in enumerate(loop):
+        before, after = loop[i - 1], loop[(i + 1) % len(loop)]
+        grid[p[0]][p[1]] = pipes[frozenset(direction(p, before) + direction(p, after))]
+    # Put the start on a straight horizontal pipe with nothing above or below
+    # pointing into it, where the solver can always work out what's underneath
+    r, c = rng.choice(
+        [
+            (r, c)
+            for r, c in loop
+            if grid[r][c] == "-"
+            and (r == 0 or grid[r - 1][c] not in "|7F")
+            and (r == size - 1 or grid[r + 1][c] not in "|LJ")
+        ]
+    )
+    grid[r][c] = "S"
+    return "\n".join("".join(row) for row in grid)
+
+
+def day11(scale: int, rng: random.Random) -> str:
+    n = side(140, scale)
+    empty_rows = set(rng.sample(range(n), n // 20))
+    empty_cols = set(rng.sample(range(n), n // 20))
+    lines = []
+    for r in range(n):
+        row = [
+            (
+                "#"
+                if r not in empty_rows and c not in empty_cols and rng.random() < 0.025
+                else "."
+            )
+            for c in range(n)
+        ]
+        lines.append("".join(row))
+    return "\n".join(lines)
+
+
+def day12(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        groups = [rng.randint(1, 6) for _ in range(rng.randint(1, 6))]
+        # Keep rows at most 20 long (with up to 3 dots of padding on each side) by
+        # dropping groups rather than truncating, so every group still fits
+        while sum(groups) + len(groups) - 1 > 14:
+            groups.pop()
+        springs = ".".join("#" * g for g in groups)
+        springs = "." * rng.randint(0, 3) + springs + "." * rng.randint(0, 3)
+        masked = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        lines.append(f"{masked} {','.join(str(g) for g in groups)}")
+    return "\n".join(lines)
+
+
+def day13(scale: int, rng: random.Random) -> str:
+    # Every pattern has one clean reflection. Random patterns very rarely also
+    # have a smudged one, so expect part 2 to mostly find nothing.
+    patterns = []
+    for _ in range(100 * scale):
+        rows, cols = rng.randint(5, 17), rng.randint(5, 17)
+        g = [rng.choices(".#", k=cols) for _ in range(rows)]
+        split = rng.randint(1, rows - 1)
+        for k in range(min(split, rows - split)):
+            g[split + k] = g[split - 1 - k][:]
+        if rng.random() < 0.5:
+            g = [list(col) for col in zip(*g)]
+        patterns.append("\n".join("".join(row) for row in g))
+    return "\n\n".join(patterns)
+
+
+def day14(scale: int, rng: random.Random) -> str:
+    n = side(100, scale)
+    return "\n".join(
+        "".join(rng.choices(".O#", weights=[7, 2, 1], k=n)) for _ in range(n)
+    )
+
+
+def day15(scale: int, rng: random.Random) -> str:
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(500)
+    ]
+    steps = []
+    for _ in range(4000 * scale):
+        label = rng.choice(labels)
+        if rng.random() < 0.5:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+    return ",".join(steps)
+
+
+def day16(scale: int, rng: random.Random) -> str:
+    n = side(110, scale)
+    return "\n".join(
+        "".join(rng.choices(".|-/\\", weights=[90, 2.5, 2.5, 2.5, 2.5], k=n))
+        for _ in range(n)
+    )
+
+
+def day17(scale: int, rng: random.Random) -> str:
+    n = side(141, scale)
+    return "\n".join("".join(rng.choices("123456789", k=n)) for _ in range(n))
+
+
+def day18(scale: int, rng: random.Random) -> str:
+    n = side(22, scale)
+
+    def plan(max_gap: int) -> list[tuple[str, int]]:
+        loop = tree_loop(rng, n, n)
+        # Stretch the loop by mapping every row/column to a new position. The
+        # mapping is increasing, so the loop stays simple.
+        rows = sorted({r for r, _ in loop})
+        cols = sorted({c for _, c in loop})
+        row_map: dict[int, int] = {}
+        col_map: dict[int, int] = {}
+        for axis, mapping in ((rows, row_map), (cols, col_map)):
+            pos = 0
+            for x in axis:
+                mapping[x] = pos
+                pos += rng.randint(2, max_gap)
+        corners = [(row_map[r], col_map[c]) for r, c in loop]
+
+        res: list[tuple[str, int]] = []
+        for (r1, c1), (r2, c2) in zip(corners, corners[1:] + corners[:1]):
+            d = "R" if c2 > c1 else "L" if c2 < c1 else "D" if r2 > r1 else "U"
+            dist = abs(r2 - r1) + abs(c2 - c1)
+            if res and res[-1][0] == d:
+                res[-1] = (d, res[-1][1] + dist)
+            else:
+                res.append((d, dist))
+        return res
+
+    part1 = plan(max_gap=10)
+    # Part 2 distances have to fit in five hex digits
+    part2 = plan(max_gap=2**20 // (4 * n))
+    # Both plans share lines, so pad the shorter one by splitting moves in two
+    for short, long in ((part1, part2), (part2, part1)):
+        while len(short) < len(long):
+            i = rng.choice([i for i, (_, dist) in enumerate(short) if dist > 1])
+            d, dist = short[i]
+            cut = rng.randint(1, dist - 1)
+            short[i : i + 1] = [(d, cut), (d, dist - cut)]
+
+    codes = {"R": 0, "D": 1, "L": 2, "U": 3}
+    return "\n".join(
+        f"{d1} {dist1} (#{dist2:05x}{codes[d2]})"
+        for (d1, dist1), (d2, dist2) in zip(part1, part2)
+    )
+
+
+def day19(scale: int, rng: random.Random) -> str:
+    count = 550 * scale
+    workflow_names = iter(names(rng, count, exclude={"in"}))
+    queue = ["in"]
+    remaining = count - 1
+    workflows = []
+    while queue:
+        name = queue.pop(0)
+        rules = []
+        for i in range(rng.randint(2, 4)):
+            if remaining > 0 and rng.random() < 0.6:
+                target = next(workflow_names)
+                queue.append(target)
+                remaining -= 1
+            else:
+                target = rng.choice("AR")
+            if i == 0 or rng.random() < 0.7:
+                op = rng.choice("<>")
+                rules.append(f"{rng.choice('xmas')}{op}{rng.randint(1, 4000)}:{target}")
+            else:
+                rules.append(target)
+                break
+        else:
+            rules.append(rng.choice("AR"))
+        workflows.append(f"{name}{{{','.join(rules)}}}")
+    rng.shuffle(workflows)
+
+    ratings = [
+        "{" + ",".join(f"{k}={rng.randint(1, 4000)}" for k in "xmas") + "}"
+        for _ in range(200 * scale)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(ratings)
+
+
+def day20(scale: int, rng: random.Random) -> str:
+    # The same shape as the real inputs, which part 2 depends on: the broadcaster
+    # drives several 12-bit binary counters built from flip-flops. Each counter's
+    # conjunction fires once the counter reaches its period, which goes through an
+    # inverter into "th" and on to "rx".
+    counters = 4 * scale
+    primes = [p for p in range(3000, 4096) if all(p % d for d in range(2, 64))]
+    periods = rng.sample(primes, counters)
+    module_names = iter(names(rng, counters * 14, exclude={"th", "rx"}))
+
+    lines = []
+    starts = []
+    inverters = []
+    for period in periods:
+        bits = [next(module_names) for _ in range(12)]
+        hub = next(module_names)
+        inverter = next(module_names)
+        starts.append(bits[0])
+        inverters.append(inverter)
+        hub_dests = [bits[0]]
+        for k, bit in enumerate(bits):
+            dests = [bits[k + 1]] if k + 1 < len(bits) else []
+            if period >> k & 1:
+                dests.append(hub)
+            elif k > 0:
+                hub_dests.append(bit)
+            lines.append(f"%{bit} -> {', '.join(dests)}")
+        lines.append(f"&{hub} -> {', '.join(hub_dests + [inverter])}")
+        lines.append(f"&{inverter} -> th")
+    lines.append("&th -> rx")
+    lines.append(f"broadcaster -> {', '.join(starts)}")
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def day21(scale: int, rng: random.Random) -> str:
+    # The start sits in the middle of an odd-sized square grid, with the middle
+    # row, middle column and border left clear like the real inputs.
+    n = side(131, scale) | 1
+    mid = n // 2
+    lines = []
+    for r in range(n):
+        row = []
+        for c in range(n):
+            if r == c == mid:
+                row.append("S")
+            elif r in (0, mid, n - 1) or c in (0, mid, n - 1):
+                row.append(".")
+            else:
+                row.append("#" if rng.random() < 0.12 else ".")
+        lines.append("".join(row))
+    return "\n".join(lines)
+
+
+def day22(scale: int, rng: random.Random) -> str:
+    # The solver assumes everything fits in a 10x10 footprint, so more bricks
+    # means a taller stack
+    occupied: set[tuple[int, int, int]] = set()
+    lines: list[str] = []
+    height = 300 * scale
+    while len(lines) < 1200 * scale:
+        axis = rng.randrange(3)
+        length = rng.randint(1, 4)
+        start = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, height)]
+        end = start[:]
+        end[axis] += length - 1
+        if end[0] > 9 or end[1] > 9:
+            continue
+        cells = {
+            (x, y, z)
+            for x in range(start[0], end[0] + 1)
+            for y in range(start[1], end[1] + 1)
+            for z in range(start[2], end[2] + 1)
+        }
+        if cells & occupied:
+            continue
+        occupied |= cells
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    return "\n".join(lines)
+
+
+def day23(scale: int, rng: random.Random) -> str:
+    # Junctions on a lattice joined by corridors, with slopes at both ends of
+    # every corridor pointing down or right, so part 1 is a DAG and part 2 is the
+    # full (undirected) lattice. The solver expects to start at (0, 1) and finish
+    # at (rows - 1, cols - 2).
+    n = side(6, scale)
+    spacing = rng.randint(20, 27)
+    size = (n - 1) * spacing + 3
+    grid = [["#"] * size for _ in range(size)]
+    for i in range(n):
+        for j in range(n):
+            r, c = 1 + i * spacing, 1 + j * spacing
+            grid[r][c] = "."
+            if j + 1 < n:
+                for k in range(1, spacing):
+                    grid[r][c + k] = ">" if k in (1, spacing - 1) else "."
+            if i + 1 < n:
+                for k in range(1, spacing):
+                    grid[r + k][c] = "v" if k in (1, spacing - 1) else "."
+    grid[0][1] = "."
+    grid[size - 1][size - 2] = "."
+    return "\n".join("".join(row) for row in grid)
+
+
+def day24(scale: int, rng: random.Random) -> str:
+    # Pick the rock first, then place every hailstone somewhere along its path
+    rock = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    lines = []
+    times = rng.sample(range(10**10, 2 * 10**11), 300 * scale)
+    for t in times:
+        velocity = [rng.randint(-500, 500) for _ in range(3)]
+        # Part 1 divides by the x velocity
+        velocity[0] = velocity[0] or 1
+        pos = [p + (v - hv) * t for p, v, hv in zip(rock, rock_velocity, velocity)]
+        lines.append(
+            ", ".join(str(p) for p in pos) + " @ " + ", ".join(str(v) for v in velocity)
+        )
+    return "\n".join(lines)
+
+
+def day25(scale: int, rng: random.Random) -> str:
+    # Two well connected halves joined by exactly three wires. Those wires are
+    # the ones the solver expects to cut for real inputs.
+    cuts = [("fts", "nvb"), ("jff", "zns"), ("kzx", "qmr")]
+    reserved = {name for cut in cuts for name in cut}
+    size = 750 * scale
+    component_names = iter(names(rng, 2 * size - 6, exclude=reserved))
+    edges: set[tuple[str, str]] = set()
+    for half, fixed in enumerate(zip(*cuts)):
+        nodes = list(fixed) + [next(component_names) for _ in range(size - 3)]
+        rng.shuffle(nodes)
+        # A cycle keeps each half connected, then add random wires until every
+        # component has at least four so the three cuts are the only way apart
+        for a, b in zip(nodes, nodes[1:] + nodes[:1]):
+            edges.add((min(a, b), max(a, b)))
+        degree = {node: 2 for node in nodes}
+        for node in nodes:
+            while degree[node] < 4 or rng.random() < 0.15:
+                other = rng.choice(nodes)
+                edge = (min(node, other), max(node, other))
+                if other == node or edge in edges:
+                    continue
+                edges.add(edge)
+                degree[node] += 1
+                degree[other] += 1
+    edges |= set(cuts)
+
+    adjacency: dict[str, list[str]] = {}
+    for a, b in edges:
+        if rng.random() < 0.5:
+            a, b = b, a
+        adjacency.setdefault(a, []).append(b)
+    lines = [f"{a}: {' '.join(bs)}" for a, bs in adjacency.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+GENERATORS: dict[int, Generator] = {
+    1: day01,
+    2: day02,
+    3: day03,
+    4: day04,
+    5: day05,
+    6: day06,
+    7: day07,
+    8: day08,
+    9: day09,
+    10: day10,
+    11: day11,
+    12: day12,
+    13: day13,
+    14: day14,
+    15: day15,
+    16: day16,
+    17: day17,
+    18: day18,
+    19: day19,
+    20: day20,
+    21: day21,
+    22: day22,
+    23: day23,
+    24: day24,
+    25: day25,
+}
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import dataclasses
+import enum
+from typing import TYPE_CHECKING, Any, Generic, Iterator, NamedTuple, Tuple, TypeVar
+
+# numpy is only needed by ArrayGrid, and most solvers that use this module never
+# touch it, so it's imported where it's used
+if TYPE_CHECKING:
+    import numpy as np
+
+Value = TypeVar("Value")
+
+
+class Direction(enum.Enum):
+    LEFT = (0, -1)
+    RIGHT = (0, 1)
+    UP = (-1, 0)
+    DOWN = (1, 0)
+    UPLEFT = (-1, -1)
+    UPRIGHT = (-1, 1)
+    DOWNLEFT = (1, -1)
+    DOWNRIGHT = (1, 1)
+
+    def __init__(self, drow: int, dcol: int) -> None:
+        # Plain attributes are much cheaper to read than .value
+        self.drow = drow
+        self.dcol = dcol
+
+    @classmethod
+    def cardinal(cls) -> list[Direction]:
+        return [Direction.LEFT, Direction.RIGHT, Direction.UP, Direction.DOWN]
+
+    @classmethod
+    def diagonal(cls) -> list[Direction]:
+        return [
+            Direction.UPLEFT,
+            Direction.UPRIGHT,
+            Direction.DOWNLEFT,
+            Direction.DOWNRIGHT,
+        ]
+
+    def __mul__(self, n: int) -> Point:
+        return Point(self.value[0] * n, self.value[1] * n)
+
+    def __rmul__(self, n: int) -> Point:
+        return self * n
+
+    def ascii(self) -> str:
+        match self:
+            case Direction.LEFT:
+                return "←"
+            case Direction.RIGHT:
+                return "→"
+            case Direction.UP:
+                return "↑"
+            case Direction.DOWN:
+                return "↓"
+            case Direction.UPLEFT:
+                return "↖"
+            case Direction.UPRIGHT:
+                return "↗"
+            case Direction.DOWNLEFT:
+                return "↙"
+            case Direction.DOWNRIGHT:
+                return "↘"
+
+    @property
+    def clockwise(self) -> Direction:
+        return self.clockwise45.clockwise45
+
+    @property
+    def clockwise45(self) -> Direction:
+        match self:
+            case Direction.LEFT:
+                return Direction.UPLEFT
+            case Direction.RIGHT:
+                return Direction.DOWNRIGHT
+            case Direction.UP:
+                return Direction.UPRIGHT
+            case Direction.DOWN:
+                return Direction.DOWNLEFT
+            case Direction.UPLEFT:
+                return Direction.UP
+            case Direction.UPRIGHT:
+                return Direction.RIGHT
+            case Direction.DOWNLEFT:
+                return Direction.LEFT
+            case Direction.DOWNRIGHT:
+                return Direction.DOWN
+
+    @property
+    def counter_clockwise(self) -> Direction:
+        # Two wrongs don't make a right, but three lefts do.
+        return self.clockwise.clockwise.clockwise
+
+    @property
+    def counter_clockwise45(self) -> Direction:
+        match self:
+            case Direction.LEFT:
+                return Direction.DOWNLEFT
+            case Direction.RIGHT:
+                return Direction.UPRIGHT
+            case Direction.UP:
+                return Direction.UPLEFT
+            case Direction.DOWN:
+                return Direction.DOWNRIGHT
+            case Direction.UPLEFT:
+                return Direction.LEFT
+            case Direction.UPRIGHT:
+                return Direction.UP
+            case Direction.DOWNLEFT:
+                return Direction.DOWN
+            case Direction.DOWNRIGHT:
+                return Direction.RIGHT
+
+    def turn_left(self) -> Direction:
+        return self.counter_clockwise
+
+    def turn_right(self) -> Direction:
+        return self.clockwise
+
+    def turn_left45(self) -> Direction:
+        return self.counter_clockwise45
+
+    def turn_right45(self) -> Direction:
+        return self.clockwise45
+
+    @property
+    def opposite(self) -> Direction:
+        return self.clockwise.clockwise
+
+    @classmethod
+    def from_str(cls, s: str) -> Direction:
+        match s.upper():
+            case "L" | "W" | "LEFT" | "WEST":
+                return Direction.LEFT
+            case "R" | "E" | "RIGHT" | "EAST":
+                return Direction.RIGHT
+            case "U" | "N" | "UP" | "NORTH":
+                return Direction.UP
+            case "D" | "S" | "DOWN" | "SOUTH":
+                return Direction.DOWN
+            case "UL" | "NW" | "UPLEFT" | "NORTHWEST":
+                return Direction.UPLEFT
+            case "UR" | "NE" | "UPRIGHT" | "NORTHEAST":
+                return Direction.UPRIGHT
+            case "DL" | "SW" | "DOWNLEFT" | "SOUTHWEST":
+                return Direction.DOWNLEFT
+            case "DR" | "SE" | "DOWNRIGHT" | "SOUTHEAST":
+                return Direction.DOWNRIGHT
+            case _:
+                raise ValueError(f"Invalid direction: {s}")
+
+
+class Point(NamedTuple):
+    """A grid position, ordered by row then column.
+
+    This is a tuple so that hashing, equality and ordering all happen in C, which
+    matters because points are created and hashed in every inner loop.
+    """
+
+    row: int
+    col: int
+
+    @property
+    def x(self) -> int:
+        return self[0]
+
+    @property
+    def y(self) -> int:
+        return self[1]
+
+    def move(self, direction: Direction) -> Point:
+        return _new(Point, (self[0] + direction.drow, self[1] + direction.dcol))
+
+    def adjacent(self) -> tuple[Point, ...]:
+        row, col = self
+        return (
+            _new(Point, (row, col - 1)),
+            _new(Point, (row, col + 1)),
+            _new(Point, (row - 1, col)),
+            _new(Point, (row + 1, col)),
+        )
+
+    def adjacent_with_dirs(self) -> tuple[tuple[Point, Direction], ...]:
+        return tuple(zip(self.adjacent(), CARDINAL))
+
+    def adjacent8(self) -> tuple[Point, ...]:
+        row, col = self
+        return tuple(_new(Point, (row + dr, col + dc)) for dr, dc in OFFSETS8)
+
+    def adjacent8_with_dirs(self) -> tuple[tuple[Point, Direction], ...]:
+        return tuple(zip(self.adjacent8(), ALL_DIRECTIONS))
+
+    def manhattan_dist(self, other: Point) -> int:
+        return abs(self[0] - other[0]) + abs(self[1] - other[1])
+
+    def euclidean_dist(self, other: Point) -> float:
+        return ((self[0] - other[0]) ** 2 + (self[1] - other[1]) ** 2) ** 0.5
+
+    def __add__(  # type: ignore[override]
+        self, other: Point | Direction | Tuple[int, int]
+    ) -> Point:
+        if isinstance(other, Direction):
+            return _new(Point, (self[0] + other.drow, self[1] + other.dcol))
+        return _new(Point, (self[0] + other[0], self[1] + other[1]))
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        # Points are always built in code, so pydantic models only need to check
+        # the type rather than taking them apart and rebuilding them
+        from pydantic_core import core_schema
+
+        return core_schema.is_instance_schema(cls)
+
+
+# Skips NamedTuple's generated __new__, which is noticeably slower
+_new = tuple.__new__
+
+CARDINAL = tuple(Direction.cardinal())
+ALL_DIRECTIONS = tuple(Direction)
+# Neighbour offsets as plain (drow, dcol) pairs, for hot loops that index into a
+# grid directly and never need a Point at all
+OFFSETS4 = tuple((d.drow, d.dcol) for d in CARDINAL)
+OFFSETS8 = tuple((d.drow, d.dcol) for d in ALL_DIRECTIONS)
+
+
+@dataclasses.dataclass
+class Line:
+    start: Point
+    end: Point
+
+    def __iter__(self) -> Iterator[Point]:
+        if self.start.row == self.end.row:
+            if self.start.col < self.end.col:
+                for yy in range(self.start.col, self.end.col + 1):
+                    yield Point(self.start.row, yy)
+            else:
+                for yy in range(self.end.col, self.start.col + 1):
+                    yield Point(self.start.row, yy)
+        else:
+            if self.start.row < self.end.row:
+                for xx in range(self.start.row, self.end.row + 1):
+                    yield Point(xx, self.start.col)
+            else:
+                for xx in range(self.end.row, self.start.row + 1):
+                    yield Point(xx, self.start.col)
+
+
+@dataclasses.dataclass
+class Grid(Generic[Value]):
+    g: list[list[Value]]
+
+    @property
+    def rows(self) -> int:
+        return len(self.g)
+
+    @property
+    def cols(self) -> int:
+        return len(self.g[0])
+
+    @property
+    def T(self) -> Grid[Value]:
+        return Grid([list(x) for x in zip(*self.g)])
+
+    def inbounds(self, p: Point) -> bool:
+        return 0 <= p.row < len(self.g) and 0 <= p.col < len(self.g[0])
+
+    def at(self, p: Point) -> Value:
+        return self.g[p.row][p.col]
+
+    def __iter__(self) -> Iterator[tuple[Point, Value]]:
+        for row in range(self.rows):
+            for col in range(self.cols):
+                yield (Point(row, col), self.g[row][col])
+
+
+# Comparing arrays with == is elementwise, so no generated __eq__
+@dataclasses.dataclass(eq=False)
+class ArrayGrid(Generic[Value]):
+    """A Grid backed by a 2-D numpy array.
+
+    Transposing, rotating and flipping return views onto the same memory rather
+    than copies, so writes through one show up in the others.
+    """
+
+    a: np.ndarray
+
+    @classmethod
+    def from_lines(cls: type[ArrayGrid[Any]], lines: list[str]) -> ArrayGrid[str]:
+        import numpy as np
+
+        return cls(np.array([list(line) for line in lines], dtype="U1"))
+
+    @classmethod
+    def from_grid(cls, grid: Grid[Value]) -> ArrayGrid[Value]:
+        import numpy as np
+
+        return cls(np.array(grid.g))
+
+    def to_grid(self) -> Grid[Value]:
+        return Grid(self.a.tolist())
+
+    def copy(self) -> ArrayGrid[Value]:
+        return ArrayGrid(self.a.copy())
+
+    @property
+    def rows(self) -> int:
+        return self.a.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.a.shape[1]
+
+    @property
+    def T(self) -> ArrayGrid[Value]:
+        return ArrayGrid(self.a.T)
+
+    def rotate(self, k: int = 1) -> ArrayGrid[Value]:
+        # Clockwise, k quarter turns
+        match k % 4:
+            case 0:
+                return ArrayGrid(self.a[:, :])
+            case 1:
+                return ArrayGrid(self.a.T[:, ::-1])
+            case 2:
+                return ArrayGrid(self.a[::-1, ::-1])
+            case _:
+                return ArrayGrid(self.a.T[::-1, :])
+
+    def flip_rows(self) -> ArrayGrid[Value]:
+        # Upside down
+        return ArrayGrid(self.a[::-1, :])
+
+    def flip_cols(self) -> ArrayGrid[Value]:
+        # Mirrored left to right
+        return ArrayGrid(self.a[:, ::-1])
+
+    def inbounds(self, p: Point) -> bool:
+        return 0 <= p[0] < self.a.shape[0] and 0 <= p[1] < self.a.shape[1]
+
+    def at(self, p: Point) -> Value:
+        return self.a[p[0], p[1]]
+
+    def mask(self, *values: Value) -> np.ndarray:
+        import numpy as np
+
+        if len(values) == 1:
+            return self.a == values[0]
+        return np.isin(self.a, np.array(values))
+
+    def find_all(self, *values: Value) -> list[Point]:
+        import numpy as np
+
+        return [
+            _new(Point, (row, col))
+            for row, col in np.argwhere(self.mask(*values)).tolist()
+        ]
+
+    def shifted(self, drow: int, dcol: int, fill: Any) -> np.ndarray:
+        # res[r, c] is the value at (r + drow, c + dcol), or fill if that's off
+        # the grid
+        import numpy as np
+
+        res = np.full_like(self.a, fill)
+        rows, cols = self.a.shape
+        if abs(drow) >= rows or abs(dcol) >= cols:
+            # Every cell would look off the grid
+            return res
+        dst_rows = slice(max(0, -drow), min(rows, rows - drow))
+        dst_cols = slice(max(0, -dcol), min(cols, cols - dcol))
+        src_rows = slice(max(0, drow), min(rows, rows + drow))
+        src_cols = slice(max(0, dcol), min(cols, cols + dcol))
+        res[dst_rows, dst_cols] = self.a[src_rows, src_cols]
+        return res
+
+    def neighbours(self, p: Point, diagonal: bool = False) -> list[tuple[Point, Value]]:
+        row, col = p
+        rows, cols = self.a.shape
+        res = []
+        for dr, dc in OFFSETS8 if diagonal else OFFSETS4:
+            r, c = row + dr, col + dc
+            if 0 <= r < rows and 0 <= c < cols:
+                res.append((_new(Point, (r, c)), self.a[r, c]))
+        return res
+
+    def count_neighbours(self, mask: np.ndarray, diagonal: bool = False) -> np.ndarray:
+        # For every cell, how many of its neighbours are set in mask
+        import numpy as np
+
+        res = np.zeros(mask.shape, dtype=np.int64)
+        for dr, dc in OFFSETS8 if diagonal else OFFSETS4:
+            res += ArrayGrid(mask).shifted(dr, dc, False)
+        return res
+
+    def __iter__(self) -> Iterator[tuple[Point, Value]]:
+        import numpy as np
+
+        for (row, col), value in np.ndenumerate(self.a):
+            yield (_new(Point, (row, col)), value)
+
+    def __str__(self) -> str:
+        return "\n".join("".join(str(x) for x in row) for row in self.a.tolist())
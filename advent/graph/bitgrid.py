@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+
+from advent.graph import Point
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class BitGrid:
+    """A boolean grid with each row packed into an int, bit j being column j.
+
+    Whole rows are compared, combined and counted with single int operations
+    (^, &, bit_count), so row-at-a-time algorithms run word-parallel instead of
+    one character at a time. Columns get the same treatment through T.
+
+    Every operation returns a new BitGrid rather than changing rows in place, so
+    the column masks are worked out at most once per grid and then kept.
+    """
+
+    def __init__(self, rows: list[int], width: int) -> None:
+        self.rows = rows
+        self.width = width
+        self.full = (1 << width) - 1
+        self._cols: list[int] | None = None
+
+    @classmethod
+    def from_lines(cls, lines: list[str], on: str = "#") -> BitGrid:
+        # translate and int(..., 2) do the per-character work in C
+        chars = set("".join(lines))
+        table = str.maketrans({c: "1" if c in on else "0" for c in chars})
+        width = len(lines[0]) if lines else 0
+        return cls(
+            [int(line.translate(table)[::-1] or "0", 2) for line in lines], width
+        )
+
+    @classmethod
+    def from_array(cls, mask: np.ndarray) -> BitGrid:
+        # From a 2-D boolean array, packing each row into bytes in C first
+        import numpy as np
+
+        width = mask.shape[1]
+        packed = np.packbits(mask, axis=1, bitorder="little")
+        return cls([int.from_bytes(row, "little") for row in packed.tolist()], width)
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    @property
+    def T(self) -> BitGrid:
+        res = BitGrid(self.cols, self.height)
+        # The transpose's columns are this grid's rows, so they come for free
+        res._cols = self.rows
+        return res
+
+    @property
+    def cols(self) -> list[int]:
+        if self._cols is None:
+            fmt = f"0{self.width}b"
+            # Reversed so that index j of each string is column j
+            bits = [format(row, fmt)[::-1] for row in self.rows]
+            self._cols = [int("".join(col)[::-1], 2) for col in zip(*bits)]
+        return self._cols
+
+    def __getitem__(self, p: Point) -> bool:
+        return bool(self.rows[p.row] >> p.col & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return self.width == other.width and self.rows == other.rows
+
+    def __hash__(self) -> int:
+        return hash((self.width, tuple(self.rows)))
+
+    def __and__(self, other: BitGrid) -> BitGrid:
+        return BitGrid([a & b for a, b in zip(self.rows, other.rows)], self.width)
+
+    def __or__(self, other: BitGrid) -> BitGrid:
+        return BitGrid([a | b for a, b in zip(self.rows, other.rows)], self.width)
+
+    def __xor__(self, other: BitGrid) -> BitGrid:
+        return BitGrid([a ^ b for a, b in zip(self.rows, other.rows)], self.width)
+
+    def __invert__(self) -> BitGrid:
+        return BitGrid([row ^ self.full for row in self.rows], self.width)
+
+    def shift(self, drow: int, dcol: int) -> BitGrid:
+        # Moves every cell by (drow, dcol), dropping whatever falls off the edge
+        # and filling in with zeros
+        rows = self.rows
+        if drow > 0:
+            rows = [0] * min(drow, len(rows)) + rows[:-drow]
+        elif drow < 0:
+            rows = rows[-drow:] + [0] * min(-drow, len(rows))
+        if dcol > 0:
+            rows = [(row << dcol) & self.full for row in rows]
+        elif dcol < 0:
+            rows = [row >> -dcol for row in rows]
+        return BitGrid(list(rows), self.width)
+
+    def count(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def runs(self) -> list[list[tuple[int, int]]]:
+        # The maximal [lo, hi) runs of set bits in each row
+        res = []
+        for row in self.rows:
+            row_runs = []
+            while row:
+                low = row & -row
+                # Adding the lowest bit carries through the whole run
+                carried = row + low
+                row_runs.append(
+                    (low.bit_length() - 1, (carried & -carried).bit_length() - 1)
+                )
+                row &= carried
+            res.append(row_runs)
+        return res
+
+    def points(self) -> Iterator[Point]:
+        for i, row in enumerate(self.rows):
+            while row:
+                low = row & -row
+                yield Point(i, low.bit_length() - 1)
+                row ^= low
+
+    def to_lines(self, on: str = "#", off: str = ".") -> list[str]:
+        fmt = f"0{self.width}b"
+        table = str.maketrans("10", on + off)
+        return [format(row, fmt)[::-1].translate(table) for row in self.rows]
+
+    def __str__(self) -> str:
+        return "\n".join(self.to_lines())
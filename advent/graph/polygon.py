@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+
+from advent.graph import Direction, Point
+
+
+class Polygon:
+    """A lattice polygon built up one edge at a time.
+
+    Only running totals are kept (never the vertices), all in exact integer
+    arithmetic, so it takes constant memory however many edges there are and
+    never loses precision to floats.
+    """
+
+    def __init__(self, origin: Point = Point(0, 0)) -> None:
+        self.origin = origin
+        self.cur = origin
+        # Shoelace sum, which is twice the signed area once the polygon is closed
+        self.twice_area_sum = 0
+        # Lattice points on the boundary (for axis-aligned edges, their lengths)
+        self.boundary = 0
+
+    def move(self, direction: Direction, dist: int) -> None:
+        row, col = self.cur
+        self.line_to(Point(row + direction.drow * dist, col + direction.dcol * dist))
+
+    def line_to(self, p: Point) -> None:
+        row, col = self.cur
+        self.twice_area_sum += col * p.row - p.col * row
+        self.boundary += math.gcd(p.row - row, p.col - col)
+        self.cur = p
+
+    @property
+    def closed(self) -> bool:
+        return self.cur == self.origin
+
+    def _closing_edge(self) -> tuple[int, int]:
+        # The (shoelace, boundary) contribution of the edge back to the origin
+        (row, col), (orow, ocol) = self.cur, self.origin
+        return col * orow - ocol * row, math.gcd(orow - row, ocol - col)
+
+    @property
+    def twice_area(self) -> int:
+        shoelace, _ = self._closing_edge()
+        return abs(self.twice_area_sum + shoelace)
+
+    @property
+    def perimeter(self) -> int:
+        _, boundary = self._closing_edge()
+        return self.boundary + boundary
+
+    @property
+    def interior(self) -> int:
+        # Pick's theorem: A = I + B / 2 - 1
+        return (self.twice_area - self.perimeter) // 2 + 1
+
+    @property
+    def lattice_points(self) -> int:
+        # Everything inside plus everything on the boundary
+        return self.interior + self.perimeter
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import dataclasses
+import heapq
+from array import array
+from typing import Callable, Iterable
+
+# Shortest paths over dense integer state ids. A solver describes its state space
+# as ids in range(size) plus a neighbours callback, and gets back flat distance
+# (and optionally parent) tables instead of dicts keyed by rich objects. How a
+# state is packed into an int is up to the solver, e.g.
+# (row * cols + col) * 4 + direction.
+UNREACHED = -1
+
+Goal = Callable[[int], bool]
+
+
+@dataclasses.dataclass
+class SearchResult:
+    dist: array[int]
+    # Only filled in when the search was asked to track parents
+    parent: array[int] | None = None
+    # The first goal state reached, if the search was given a goal
+    goal: int | None = None
+
+    def reached(self, state: int) -> bool:
+        return self.dist[state] != UNREACHED
+
+    def path(self, state: int) -> list[int]:
+        if self.parent is None:
+            raise ValueError("Search didn't track parents")
+        if not self.reached(state):
+            raise ValueError(f"State {state} was never reached")
+        res = [state]
+        while self.parent[res[-1]] != UNREACHED:
+            res.append(self.parent[res[-1]])
+        return res[::-1]
+
+
+def table(size: int) -> array[int]:
+    return array("q", [UNREACHED]) * size
+
+
+def dijkstra(
+    size: int,
+    starts: Iterable[int],
+    neighbours: Callable[[int], Iterable[tuple[int, int]]],
+    goal: Goal | None = None,
+    parents: bool = False,
+) -> SearchResult:
+    """Neighbours are (state, cost) pairs with non-negative costs."""
+    dist = table(size)
+    parent = table(size) if parents else None
+    done = bytearray(size)
+    heap: list[tuple[int, int]] = []
+    for s in starts:
+        dist[s] = 0
+        heap.append((0, s))
+    heapq.heapify(heap)
+
+    while heap:
+        d, state = heapq.heappop(heap)
+        # Stale entries are left in the heap rather than decreasing keys
+        if done[state]:
+            continue
+        done[state] = 1
+        if goal is not None and goal(state):
+            return SearchResult(dist, parent, state)
+        for n, cost in neighbours(state):
+            nd = d + cost
+            if not done[n] and (dist[n] == UNREACHED or nd < dist[n]):
+                dist[n] = nd
+                if parent is not None:
+                    parent[n] = state
+                heapq.heappush(heap, (nd, n))
+    return SearchResult(dist, parent)
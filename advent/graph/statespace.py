@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+
+class Visited:
+    """A fixed-size visited set for states made of a position plus a few flags.
+
+    Positions are ints (usually row * cols + col) and each one gets a bitmask of
+    flags (a direction, a step counter, ...) packed into bytes, so marking a state
+    never allocates, and per-position questions reduce to C-level byte
+    operations.
+    """
+
+    def __init__(self, positions: int, flags: int) -> None:
+        self.positions = positions
+        self.flags = flags
+        self.stride = (flags + 7) // 8
+        self.buf = bytearray(positions * self.stride)
+        self._zeros = bytes(len(self.buf))
+
+    def add(self, pos: int, flag: int) -> bool:
+        # Test-and-set, which is True if the state is new
+        i = pos * self.stride + (flag >> 3)
+        bit = 1 << (flag & 7)
+        b = self.buf[i]
+        if b & bit:
+            return False
+        self.buf[i] = b | bit
+        return True
+
+    def seen(self, pos: int, flag: int) -> bool:
+        return bool(self.buf[pos * self.stride + (flag >> 3)] & (1 << (flag & 7)))
+
+    def position_mask(self) -> bytes:
+        # One byte per position, non-zero if any of its flags are set
+        if self.stride == 1:
+            return bytes(self.buf)
+        combined = 0
+        for k in range(self.stride):
+            combined |= int.from_bytes(self.buf[k :: self.stride], "little")
+        return combined.to_bytes(self.positions, "little")
+
+    def count(self) -> int:
+        return int.from_bytes(self.buf, "little").bit_count()
+
+    def count_positions(self) -> int:
+        mask = self.position_mask()
+        return len(mask) - mask.count(0)
+
+    def touched(self) -> Iterator[int]:
+        for pos, b in enumerate(self.position_mask()):
+            if b:
+                yield pos
+
+    def clear(self) -> None:
+        # Copying over a pre-made block of zeros is a memcpy, so reusing one
+        # Visited across many searches is much cheaper than making new ones
+        self.buf[:] = self._zeros
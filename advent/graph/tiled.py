@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from advent.graph import Point
+
+
+class TiledGrid:
+    """An infinite plane tiled with copies of one grid."""
+
+    def __init__(self, lines: list[str]) -> None:
+        self.g = lines
+        self.rows = len(lines)
+        self.cols = len(lines[0])
+
+    def reachable_counts(
+        self, start: Point, max_steps: int, blocked: str = "#"
+    ) -> list[int]:
+        # res[n] is how many cells can be reached in exactly n steps. The plane is
+        # bipartite, so a cell first reached at step k can also be reached at
+        # k + 2, k + 4, ... and the answer for n is the number of cells first
+        # reached at a step with the same parity as n. A BFS that only keeps the
+        # last two frontiers gets every n <= max_steps in one pass.
+        rows, cols = self.rows, self.cols
+        open_cells = bytearray(c != blocked for line in self.g for c in line)
+        # Cells are packed as (row + row_offset) * span + (col + col_offset). The
+        # offsets keep everything within max_steps of the start non-negative, and
+        # because they (and span) are whole numbers of tiles, the cell within the
+        # tile is just (key // span % rows, key % cols)
+        row_offset = rows * (max_steps // rows + 1)
+        col_offset = cols * (max_steps // cols + 1)
+        span = 2 * col_offset + cols
+        key = (start.row + row_offset) * span + start.col + col_offset
+
+        counts = [0, 0]
+        res = []
+        prev: set[int] = set()
+        cur = {key}
+        for step in range(max_steps + 1):
+            counts[step % 2] += len(cur)
+            res.append(counts[step % 2])
+            nxt = set()
+            for k in cur:
+                for n in (k - 1, k + 1, k - span, k + span):
+                    if open_cells[n // span % rows * cols + n % cols] and n not in prev:
+                        nxt.add(n)
+            prev, cur = cur, nxt
+        return res
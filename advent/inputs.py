@@ -0,0 +1,81 @@
+import hashlib
+import logging
+import mmap
+import os
+import pathlib
+
+from advent.paths import STATE_DIR
+
+# Inputs are stored by content hash under objects/, and refs/dayNN records which
+# object is the current input for a day. Once a day has been fetched we never
+# need to talk to aocd (or the network) again.
+STORE_DIR = STATE_DIR / "inputs"
+
+
+def read(path: pathlib.Path) -> str:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Decode straight out of the mapping instead of reading into an
+            # intermediate bytes object first
+            with memoryview(mm) as view:
+                return str(view, "utf-8")
+
+
+def object_path(digest: str) -> pathlib.Path:
+    return STORE_DIR / "objects" / digest[:2] / digest
+
+
+def ref_path(day: int) -> pathlib.Path:
+    return STORE_DIR / "refs" / f"day{day:02d}"
+
+
+def cached_path(day: int) -> pathlib.Path | None:
+    ref = ref_path(day)
+    if not ref.exists():
+        return None
+    path = object_path(ref.read_text().strip())
+    return path if path.exists() else None
+
+
+def store(day: int, data: str) -> pathlib.Path:
+    raw = data.encode()
+    digest = hashlib.sha256(raw).hexdigest()
+    path = object_path(digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(raw)
+        tmp.replace(path)
+    ref = ref_path(day)
+    ref.parent.mkdir(parents=True, exist_ok=True)
+    ref.write_text(digest)
+    return path
+
+
+def path_for(
+    day: int,
+    input_path: pathlib.Path | None = None,
+    input_dir: pathlib.Path | None = None,
+) -> pathlib.Path:
+    if input_path is not None:
+        return input_path
+    if input_dir is not None:
+        return input_dir / f"day{day:02d}.txt"
+
+    path = cached_path(day)
+    if path is None:
+        import aocd
+
+        logging.getLogger().info(f"Fetching input for day {day} from aocd")
+        path = store(day, aocd.get_data(day=day, year=2023))
+    return path
+
+
+def load(
+    day: int,
+    input_path: pathlib.Path | None = None,
+    input_dir: pathlib.Path | None = None,
+) -> str:
+    return read(path_for(day, input_path=input_path, input_dir=input_dir))
@@ -1,57 +1,279 @@
 from __future__ import annotations
 
-import pydantic
+import bisect
+import math
+from typing import Iterable, Iterator, NamedTuple
 
 
-class OverlapResult(pydantic.BaseModel):
-    intersected: list[Interval]
-    carried: list[Interval]
+class IntervalSet:
+    """A set of integers stored as sorted, disjoint half-open ranges [lo, hi).
 
+    Ranges that overlap or touch are merged as they go in, so there is only ever
+    one way to store a given set. Lookups and single-range edits bisect into the
+    range bounds, and combining two sets costs time in the number of ranges
+    involved rather than the product of their sizes.
+    """
 
-class Interval(pydantic.BaseModel):
-    """Represents a half-open interval [lo, hi) of integers."""
+    __slots__ = ("los", "his")
 
-    lo: int
-    hi: int
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        self.los: list[int] = []
+        self.his: list[int] = []
+        for lo, hi in sorted(r for r in ranges if r[0] < r[1]):
+            if self.his and lo <= self.his[-1]:
+                self.his[-1] = max(self.his[-1], hi)
+            else:
+                self.los.append(lo)
+                self.his.append(hi)
+
+    @classmethod
+    def _from_sorted(cls, los: list[int], his: list[int]) -> IntervalSet:
+        # The caller guarantees the ranges are already sorted, disjoint and apart
+        res = cls.__new__(cls)
+        res.los = los
+        res.his = his
+        return res
+
+    def copy(self) -> IntervalSet:
+        return IntervalSet._from_sorted(self.los[:], self.his[:])
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.los, self.his)
+
+    def __len__(self) -> int:
+        return len(self.los)
+
+    def __bool__(self) -> bool:
+        return bool(self.los)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.los == other.los and self.his == other.his
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __contains__(self, x: int) -> bool:
+        i = bisect.bisect_right(self.los, x) - 1
+        return i >= 0 and x < self.his[i]
+
+    @property
+    def lo(self) -> int:
+        return self.los[0]
+
+    @property
+    def hi(self) -> int:
+        return self.his[-1]
+
+    def size(self) -> int:
+        return sum(self.his) - sum(self.los)
+
+    def add(self, lo: int, hi: int) -> None:
+        if lo >= hi:
+            return
+        # Ranges i..j-1 overlap or touch [lo, hi), and get merged into it
+        i = bisect.bisect_left(self.his, lo)
+        j = bisect.bisect_right(self.los, hi)
+        if i < j:
+            lo = min(lo, self.los[i])
+            hi = max(hi, self.his[j - 1])
+        self.los[i:j] = [lo]
+        self.his[i:j] = [hi]
+
+    def remove(self, lo: int, hi: int) -> None:
+        if lo >= hi:
+            return
+        # Ranges i..j-1 overlap [lo, hi), and only the bits sticking out survive
+        i = bisect.bisect_right(self.his, lo)
+        j = bisect.bisect_left(self.los, hi)
+        if i >= j:
+            return
+        los, his = [], []
+        if self.los[i] < lo:
+            los.append(self.los[i])
+            his.append(lo)
+        if hi < self.his[j - 1]:
+            los.append(hi)
+            his.append(self.his[j - 1])
+        self.los[i:j] = los
+        self.his[i:j] = his
+
+    def clip(self, lo: int, hi: int) -> IntervalSet:
+        # The part of the set inside [lo, hi)
+        i = bisect.bisect_right(self.his, lo)
+        j = bisect.bisect_left(self.los, hi)
+        if i >= j:
+            return IntervalSet()
+        los = self.los[i:j]
+        his = self.his[i:j]
+        los[0] = max(los[0], lo)
+        his[-1] = min(his[-1], hi)
+        return IntervalSet._from_sorted(los, his)
+
+    def shift(self, delta: int) -> IntervalSet:
+        return IntervalSet._from_sorted(
+            [lo + delta for lo in self.los], [hi + delta for hi in self.his]
+        )
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        res = self.copy()
+        for lo, hi in other:
+            res.add(lo, hi)
+        return res
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        # Clip the set with more ranges by each range of the smaller one
+        small, big = sorted((self, other), key=len)
+        los: list[int] = []
+        his: list[int] = []
+        for lo, hi in small:
+            part = big.clip(lo, hi)
+            los.extend(part.los)
+            his.extend(part.his)
+        return IntervalSet._from_sorted(los, his)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        res = self.copy()
+        for lo, hi in other:
+            res.remove(lo, hi)
+        return res
+
+
+class ShiftMap:
+    """A piecewise-linear map on the integers where every piece is a shift.
+
+    bounds are the sorted breakpoints, and x maps to x + offsets[i] where i is
+    the number of breakpoints <= x, so the map is the identity before the first
+    breakpoint and after the last.
+    """
+
+    __slots__ = ("bounds", "offsets")
+
+    def __init__(
+        self, bounds: list[int] | None = None, offsets: list[int] | None = None
+    ) -> None:
+        self.bounds = bounds or []
+        self.offsets = offsets or [0] * (len(self.bounds) + 1)
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int, int]]) -> ShiftMap:
+        # (lo, hi, delta) shifts [lo, hi) by delta, and where ranges overlap the
+        # first one wins
+        covered = IntervalSet()
+        pieces: list[tuple[int, int, int]] = []
+        for lo, hi, delta in ranges:
+            fresh = IntervalSet([(lo, hi)]) - covered
+            pieces.extend((plo, phi, delta) for plo, phi in fresh)
+            covered.add(lo, hi)
+        pieces.sort()
+
+        res = cls()
+        for lo, hi, delta in pieces:
+            res._append(lo, delta)
+            res._append(hi, 0)
+        return res
+
+    def _append(self, bound: int, offset: int) -> None:
+        # Starts a piece with this offset at bound, skipping breakpoints that
+        # wouldn't change anything
+        if offset == self.offsets[-1]:
+            return
+        if self.bounds and self.bounds[-1] == bound:
+            self.offsets[-1] = offset
+            if len(self.offsets) > 1 and self.offsets[-2] == offset:
+                self.bounds.pop()
+                self.offsets.pop()
+            return
+        self.bounds.append(bound)
+        self.offsets.append(offset)
+
+    def __call__(self, x: int) -> int:
+        return x + self.offsets[bisect.bisect_right(self.bounds, x)]
+
+    def apply(self, xs: Iterable[int]) -> list[int]:
+        bounds, offsets = self.bounds, self.offsets
+        return [x + offsets[bisect.bisect_right(bounds, x)] for x in xs]
+
+    def pieces(self) -> Iterator[tuple[int | None, int | None, int]]:
+        # (lo, hi, offset) for every piece, with None for the unbounded ends
+        edges = [None, *self.bounds, None]
+        return zip(edges, edges[1:], self.offsets)
+
+    def then(self, other: ShiftMap) -> ShiftMap:
+        # The map x -> other(self(x)). Each piece of self lands on a shifted
+        # range, which other's breakpoints may cut up further.
+        res = ShiftMap()
+        for lo, hi, offset in self.pieces():
+            i = 0 if lo is None else bisect.bisect_right(other.bounds, lo + offset)
+            j = (
+                len(other.bounds)
+                if hi is None
+                else bisect.bisect_left(other.bounds, hi + offset)
+            )
+            if lo is None:
+                res.offsets[0] = offset + other.offsets[i]
+            else:
+                res._append(lo, offset + other.offsets[i])
+            for k in range(i, j):
+                res._append(other.bounds[k] - offset, offset + other.offsets[k + 1])
+        return res
+
+    def image(self, ranges: IntervalSet) -> IntervalSet:
+        res = IntervalSet()
+        for lo, hi in ranges:
+            i = bisect.bisect_right(self.bounds, lo)
+            j = bisect.bisect_left(self.bounds, hi)
+            cuts = [lo, *self.bounds[i:j], hi]
+            for k, (a, b) in enumerate(zip(cuts, cuts[1:])):
+                offset = self.offsets[i + k]
+                res.add(a + offset, b + offset)
+        return res
+
+
+class Box(NamedTuple):
+    """An axis-aligned box of integer points, half-open [lo[i], hi[i]) on each
+    axis."""
+
+    lo: tuple[int, ...]
+    hi: tuple[int, ...]
+
+    @classmethod
+    def cube(cls, dims: int, lo: int, hi: int) -> Box:
+        return cls((lo,) * dims, (hi,) * dims)
+
+    @classmethod
+    def point(cls, coords: Iterable[int]) -> Box:
+        lo = tuple(coords)
+        return cls(lo, tuple(c + 1 for c in lo))
+
+    @property
+    def dims(self) -> int:
+        return len(self.lo)
 
     @property
     def empty(self) -> bool:
-        return self.lo >= self.hi
+        return any(lo >= hi for lo, hi in zip(self.lo, self.hi))
+
+    def volume(self) -> int:
+        return math.prod(max(hi - lo, 0) for lo, hi in zip(self.lo, self.hi))
+
+    def split(self, axis: int, threshold: int) -> tuple[Box | None, Box | None]:
+        # The parts below and at or above threshold along axis, with None for
+        # parts that would be empty
+        lo, hi = self.lo[axis], self.hi[axis]
+        cut = min(max(threshold, lo), hi)
+        below = above = None
+        if lo < cut:
+            below = Box(self.lo, self.hi[:axis] + (cut,) + self.hi[axis + 1 :])
+        if cut < hi:
+            above = Box(self.lo[:axis] + (cut,) + self.lo[axis + 1 :], self.hi)
+        return below, above
 
-    def __and__(self, other: Interval) -> Interval:
-        return Interval(
-            lo=max(self.lo, other.lo),
-            hi=min(self.hi, other.hi),
+    def __and__(self, other: Box) -> Box:
+        return Box(
+            tuple(map(max, self.lo, other.lo)), tuple(map(min, self.hi, other.hi))
         )
 
-    def overlap(self, interval: Interval) -> OverlapResult:
-        intersected = []
-        carried = []
-
-        intersection_start = max(self.lo, interval.lo)
-        intersection_end = min(self.hi, interval.hi)
-        if intersection_start <= intersection_end:
-            intersected.append(Interval(lo=intersection_start, hi=intersection_end))
-
-            if interval.lo < self.lo:
-                carried.append(Interval(lo=interval.lo, hi=intersection_start))
-            if self.hi < interval.hi:
-                carried.append(Interval(lo=intersection_end, hi=interval.hi))
-        else:
-            carried.append(interval)
-        return OverlapResult(intersected=intersected, carried=carried)
-
-
-class IntervalSet(pydantic.BaseModel):
-    intervals: list[Interval] = pydantic.Field(default_factory=list)
-
-    def overlap_all(self, intervals: list[Interval]) -> OverlapResult:
-        intersected = []
-        for my_interval in self.intervals:
-            new_working_intervals = []
-            for interval in intervals:
-                this_result = my_interval.overlap(interval)
-                intersected.extend(this_result.intersected)
-                new_working_intervals.extend(this_result.carried)
-            intervals = new_working_intervals
-        return OverlapResult(intersected=intersected, carried=intervals)
+    def contains(self, coords: tuple[int, ...]) -> bool:
+        return all(lo <= c < hi for lo, c, hi in zip(self.lo, coords, self.hi))
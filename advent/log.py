@@ -26,3 +26,10 @@ class ColoredLogFormatter(logging.Formatter):
             log_fmt = self.FORMATS.get(record.levelno)
             formatter = logging.Formatter(log_fmt)
         return formatter.format(record)
+
+
+def setup_logging(level: int) -> logging.Logger:
+    logging.basicConfig(level=level)
+    logger = logging.getLogger()
+    logger.handlers[0].setFormatter(ColoredLogFormatter())
+    return logger
@@ -0,0 +1,100 @@
+import contextlib
+import dataclasses
+import logging
+import os
+import resource
+import sys
+import tracemalloc
+from typing import Iterator
+
+from advent.colors import blue
+
+
+@dataclasses.dataclass
+class MemoryUsage:
+    traced_peak: int
+    traced_current: int
+    rss: int
+    peak_rss: int
+
+
+def human(n: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}GiB"
+
+
+def current_rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # No procfs (e.g. macOS), so the best we can do is the high-water mark
+        return peak_rss()
+
+
+def peak_rss() -> int:
+    # ru_maxrss is in bytes on macOS but KiB everywhere else
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class PhaseMemory:
+    """Records the tracemalloc peak and process RSS for each phase."""
+
+    def __init__(self, top: int = 0) -> None:
+        self.top = top
+        self.logger = logging.getLogger()
+        self.usage: dict[str, MemoryUsage] = {}
+
+    @contextlib.contextmanager
+    def __call__(self, phase: str) -> Iterator[None]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            rss = current_rss()
+            # ru_maxrss is only sampled now and then, and can lag behind what
+            # statm reports right now
+            usage = MemoryUsage(peak, current, rss, max(rss, peak_rss()))
+            self.usage[phase] = usage
+            self.logger.info(
+                blue(
+                    f"{phase} memory: peak {human(usage.traced_peak)}, "
+                    f"live {human(usage.traced_current)}, RSS {human(usage.rss)} "
+                    f"(max {human(usage.peak_rss)})"
+                )
+            )
+            if self.top > 0:
+                self.log_top_sites(phase)
+
+    def log_top_sites(self, phase: str) -> None:
+        import cProfile
+        import pstats
+
+        from advent import profiling
+
+        # Leave out tracemalloc's own bookkeeping, the import system, and the
+        # profiler when --profile is running alongside
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, cProfile.__file__),
+                tracemalloc.Filter(False, pstats.__file__),
+                tracemalloc.Filter(False, profiling.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ]
+        )
+        self.logger.info(f"Top {self.top} live allocation sites after {phase}:")
+        for stat in snapshot.statistics("lineno")[: self.top]:
+            frame = stat.traceback[0]
+            self.logger.info(
+                f"  {frame.filename}:{frame.lineno}: {human(stat.size)} "
+                f"in {stat.count} blocks"
+            )
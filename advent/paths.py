@@ -0,0 +1,8 @@
+import os
+import pathlib
+
+# Local state (timings, cached inputs, results, ...) lives next to the package
+# rather than inside it so that it never ends up committed.
+STATE_DIR = pathlib.Path(
+    os.environ.get("ADVENT_STATE_DIR", pathlib.Path(__file__).parent.parent / ".advent")
+)
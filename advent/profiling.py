@@ -0,0 +1,99 @@
+import collections
+import contextlib
+import cProfile
+import logging
+import pathlib
+import pstats
+from typing import Iterator
+
+from advent.paths import STATE_DIR
+
+PROFILE_DIR = STATE_DIR / "profiles"
+
+# (filename, lineno, function name), as used by pstats
+Func = tuple[str, int, str]
+
+
+def frame_name(func: Func) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        # Builtins don't have a file
+        label = name
+    else:
+        label = f"{name} ({pathlib.Path(filename).name}:{lineno})"
+    # Semicolons separate frames in the collapsed format
+    return label.replace(";", ",")
+
+
+def collapse(stats: pstats.Stats, root: str, min_us: int = 1) -> dict[str, int]:
+    # cProfile only records caller -> callee edges rather than whole stacks, so
+    # this is an approximation: each function's time is split between its
+    # callers in proportion to the time spent along each edge.
+    raw = stats.stats  # type: ignore
+    children: dict[Func, dict[Func, float]] = collections.defaultdict(dict)
+    # The profiler is enabled partway down the stack, so some calls came from
+    # frames that never made it into the stats. Whatever time isn't explained by
+    # a recorded caller is treated as a root of its own.
+    roots: dict[Func, float] = {}
+    for func, (_, _, _, ct, callers) in raw.items():
+        attributed = 0.0
+        for caller, (_, _, _, edge_ct) in callers.items():
+            if caller != func and caller in raw:
+                children[caller][func] = edge_ct
+                attributed += edge_ct
+        if ct > 0 and (ct - attributed) * 1e6 >= min_us:
+            roots[func] = (ct - attributed) / ct
+
+    res: dict[str, int] = collections.Counter()
+
+    def visit(func: Func, stack: str, path: set[Func], scale: float) -> None:
+        _, _, tt, ct, _ = raw[func]
+        stack = f"{stack};{frame_name(func)}"
+        self_us = int(tt * scale * 1e6)
+        if self_us >= min_us:
+            res[stack] += self_us
+
+        path.add(func)
+        for child, edge_ct in children[func].items():
+            child_ct = raw[child][3]
+            if child in path or child_ct <= 0:
+                continue
+            child_scale = scale * edge_ct / child_ct
+            if child_ct * child_scale * 1e6 >= min_us:
+                visit(child, stack, path, child_scale)
+        path.remove(func)
+
+    for func, scale in roots.items():
+        visit(func, root, set(), scale)
+    return res
+
+
+class PhaseProfiler:
+    """Writes a .prof file per phase plus one collapsed stack file for all phases."""
+
+    def __init__(self, day: int, label: str, out_dir: pathlib.Path = PROFILE_DIR):
+        self.out_dir = out_dir
+        self.stem = f"day{day:02d}-{label}"
+        self.collapsed_path = out_dir / f"{self.stem}.collapsed"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.collapsed_path.write_text("")
+
+    @contextlib.contextmanager
+    def __call__(self, phase: str) -> Iterator[None]:
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.write(phase, profile)
+
+    def write(self, phase: str, profile: cProfile.Profile) -> None:
+        prof_path = self.out_dir / f"{self.stem}-{phase}.prof"
+        profile.dump_stats(prof_path)
+
+        stats = pstats.Stats(profile)
+        with open(self.collapsed_path, "a") as f:
+            for stack, us in collapse(stats, root=phase).items():
+                f.write(f"{stack} {us}\n")
+        logging.getLogger().info(f"Wrote {phase} profile to {prof_path}")
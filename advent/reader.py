@@ -1,4 +1,20 @@
-from typing import Iterator
+from __future__ import annotations
+
+import codecs
+import contextlib
+import hashlib
+import io
+import mmap
+import os
+import pathlib
+import warnings
+from array import array
+from typing import TYPE_CHECKING, Iterator
+
+from advent import inputs
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def lines(s: str) -> Iterator[str]:
@@ -24,3 +40,146 @@ def all_ints(s: str) -> Iterator[int]:
 def all_tokens(s: str) -> Iterator[str]:
     for line in lines(s):
         yield from tokens(line)
+
+
+# The bulk readers below parse a whole input at once, treating any character in
+# sep as whitespace, so "19, 13, 30 @ -2,  1, -2" is read with sep=",@"
+
+
+def _spaced(s: str, sep: str) -> str:
+    return s.translate(str.maketrans(sep, " " * len(sep))) if sep else s
+
+
+def int_array(s: str, sep: str = "") -> np.ndarray:
+    import numpy as np
+
+    # Values must fit in 64 bits. fromstring does the splitting and parsing in C,
+    # but stops at the first bad token with only a warning, and clamps values
+    # that don't fit to the int64 bounds without any warning at all. It also reads
+    # a string that's nothing but whitespace as a single 0.
+    text = _spaced(s, sep)
+    if text.isspace():
+        return np.empty(0, dtype=np.int64)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            res = np.fromstring(text, dtype=np.int64, sep=" ")
+        except DeprecationWarning as e:
+            raise ValueError(f"Non-integer token in input: {e}") from None
+
+    bounds = np.iinfo(np.int64)
+    if res.size and (res.max() == bounds.max or res.min() == bounds.min):
+        # Either a real int64 bound or a clamped value, so parse it again slowly
+        # to find out which
+        try:
+            return np.array([int(token) for token in text.split()], dtype=np.int64)
+        except OverflowError:
+            raise ValueError("Input has an int that doesn't fit in 64 bits") from None
+    return res
+
+
+def int_rows(s: str, sep: str = "") -> np.ndarray:
+    # One row per non-blank line, which must all hold the same number of ints
+    rows = [line for line in s.splitlines() if line.strip()]
+    flat = int_array(s, sep)
+    width = len(_spaced(rows[0], sep).split()) if rows else 0
+    if flat.size != len(rows) * width:
+        raise ValueError(f"Expected {len(rows)} rows of {width} ints")
+    return flat.reshape(len(rows), width)
+
+
+def packed_ints(s: str, sep: str = "") -> array[int]:
+    # Like int_array (including the 64-bit limit, which raises OverflowError),
+    # for when numpy isn't worth importing
+    return array("q", map(int, _spaced(s, sep).split()))
+
+
+class Source:
+    """An input that is read a piece at a time instead of as one big str.
+
+    File inputs are memory-mapped, so the OS pages them in and out as they're
+    read and only the current line or token is ever decoded. Inputs that are
+    already in memory (examples, generated inputs) work the same way.
+    """
+
+    CHUNK = 1 << 20
+
+    def __init__(
+        self, path: pathlib.Path | None = None, text: str | None = None
+    ) -> None:
+        # Only the path (or text) is kept, so a Source pickles cheaply and each
+        # read opens its own mapping
+        self.path = path
+        self.text = text
+
+    @classmethod
+    def from_path(cls, path: pathlib.Path) -> Source:
+        return cls(path=path)
+
+    @classmethod
+    def from_text(cls, text: str) -> Source:
+        return cls(text=text)
+
+    @contextlib.contextmanager
+    def _mapped(self) -> Iterator[mmap.mmap | None]:
+        assert self.path is not None
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield None
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+    def read(self) -> str:
+        if self.text is not None:
+            return self.text
+        assert self.path is not None
+        return inputs.read(self.path)
+
+    def digest(self) -> str:
+        if self.text is not None:
+            return hashlib.sha256(self.text.encode()).hexdigest()
+        with self._mapped() as mm:
+            # hashlib reads straight out of the mapping
+            return hashlib.sha256(mm if mm is not None else b"").hexdigest()
+
+    def lines(self) -> Iterator[str]:
+        # Lines are split on "\n" only, with a trailing "\n" or "\r\n" stripped from
+        # each, the same for text and mapped files
+        if self.text is not None:
+            for text_line in io.StringIO(self.text):
+                yield text_line.removesuffix("\n").removesuffix("\r")
+            return
+        with self._mapped() as mm:
+            if mm is None:
+                return
+            for raw_line in iter(mm.readline, b""):
+                yield raw_line.removesuffix(b"\n").removesuffix(b"\r").decode()
+
+    def chunks(self) -> Iterator[str]:
+        if self.text is not None:
+            for i in range(0, len(self.text), self.CHUNK):
+                yield self.text[i : i + self.CHUNK]
+            return
+        # A chunk boundary can land in the middle of a multi-byte character, which
+        # the incremental decoder holds back until the next chunk
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with self._mapped() as mm:
+            if mm is None:
+                return
+            for i in range(0, len(mm), self.CHUNK):
+                yield decoder.decode(mm[i : i + self.CHUNK])
+        yield decoder.decode(b"", final=True)
+
+    def tokens(self, sep: str = ",") -> Iterator[str]:
+        # Tokens with surrounding whitespace (including newlines) stripped, and
+        # empty ones skipped
+        pending = ""
+        for chunk in self.chunks():
+            parts = (pending + chunk).split(sep)
+            pending = parts.pop()
+            for part in parts:
+                if part := part.strip():
+                    yield part
+        if pending := pending.strip():
+            yield pending
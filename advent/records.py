@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+from typing import Any, Callable, TypeVar, overload
+
+if sys.version_info >= (3, 11):
+    from typing import dataclass_transform
+else:
+    from typing_extensions import dataclass_transform
+
+T = TypeVar("T")
+
+
+@overload
+def record(cls: type[T], /) -> type[T]: ...
+
+
+@overload
+def record(*, frozen: bool = False) -> Callable[[type[T]], type[T]]: ...
+
+
+@dataclass_transform()
+def record(cls: type[T] | None = None, /, *, frozen: bool = False) -> Any:
+    # A slotted dataclass, for models that get made in hot loops. Building one
+    # just assigns its fields, with none of pydantic's validation; use validated
+    # where the values come straight from the input.
+    def wrap(cls: type[T]) -> type[T]:
+        return dataclasses.dataclass(cls, slots=True, frozen=frozen)
+
+    return wrap if cls is None else wrap(cls)
+
+
+_adapters: dict[type, Any] = {}
+
+
+def validated(cls: type[T], **fields: Any) -> T:
+    # Builds a record the way a pydantic model would, checking (and coercing)
+    # every field against its annotation. The adapter for each class is built once.
+    adapter = _adapters.get(cls)
+    if adapter is None:
+        import pydantic
+
+        adapter = _adapters[cls] = pydantic.TypeAdapter(cls)
+    return adapter.validate_python(fields)
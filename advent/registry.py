@@ -0,0 +1,29 @@
+import importlib
+import inspect
+import pathlib
+
+from advent.base import BaseSolver
+
+PACKAGE_DIR = pathlib.Path(__file__).parent
+
+
+def days() -> list[int]:
+    return sorted(int(p.stem[3:]) for p in PACKAGE_DIR.glob("day[0-9][0-9].py"))
+
+
+def module_name(day: int) -> str:
+    return f"advent.day{day:02d}"
+
+
+def load(day: int) -> type[BaseSolver]:
+    # Day modules only call Solver.run() under __main__, so importing them here
+    # gives us the solver class without kicking off a run.
+    module = importlib.import_module(module_name(day))
+    for _, cls in inspect.getmembers(module, inspect.isclass):
+        if (
+            issubclass(cls, BaseSolver)
+            and cls is not BaseSolver
+            and cls.__module__ == module.__name__
+        ):
+            return cls
+    raise ValueError(f"No solver found in {module.__name__}")
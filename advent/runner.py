@@ -0,0 +1,337 @@
+import argparse
+import concurrent.futures
+import dataclasses
+import functools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import pathlib
+import resource
+import signal
+import time
+from multiprocessing.connection import Connection
+
+from rich.console import Console
+from rich.table import Table
+
+from advent import cache, registry
+from advent.base import PHASES, PhaseResult, Result, TimedSolution
+from advent.log import setup_logging
+from advent.paths import STATE_DIR
+from advent.reader import Source
+
+TIMINGS_PATH = STATE_DIR / "timings.json"
+
+
+@dataclasses.dataclass
+class DayResult:
+    day: int
+    part1: Result | None = None
+    part2: Result | None = None
+    parse_elapsed: float = 0.0
+    part1_elapsed: float = 0.0
+    part2_elapsed: float = 0.0
+    wall: float = 0.0
+    cached: bool = False
+    error: str | None = None
+    # The phase that was running when the error happened
+    failed_phase: str | None = None
+
+    def completed(self, phase: str) -> bool:
+        if self.failed_phase is None:
+            return self.error is None
+        return PHASES.index(phase) < PHASES.index(self.failed_phase)
+
+
+@dataclasses.dataclass
+class Budget:
+    # Each phase gets the full budget, rather than the day as a whole
+    timeout: float | None = None
+    memory: int | None = None
+
+
+@dataclasses.dataclass
+class PhaseFailure:
+    phase: str
+    error: str
+
+
+def load_timings() -> dict[int, float]:
+    if not TIMINGS_PATH.exists():
+        return {}
+    with open(TIMINGS_PATH) as f:
+        return {int(day): elapsed for day, elapsed in json.load(f).items()}
+
+
+def save_timings(results: list[DayResult]) -> None:
+    timings = load_timings()
+    for res in results:
+        if res.error is None and not res.cached:
+            timings[res.day] = res.wall
+    TIMINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(TIMINGS_PATH, "w") as f:
+        json.dump({str(day): timings[day] for day in sorted(timings)}, f, indent=2)
+
+
+def schedule(days: list[int], timings: dict[int, float]) -> list[int]:
+    # Longest first so the slowest day never starts last. Days we haven't timed
+    # yet could be anything, so assume the worst and start them right away.
+    return sorted(days, key=lambda day: timings.get(day, math.inf), reverse=True)
+
+
+def run_day(
+    day: int,
+    input_dir: pathlib.Path | None = None,
+    scale: int | None = None,
+    seed: int = 0,
+    use_cache: bool = True,
+    budget: Budget | None = None,
+) -> DayResult:
+    res = DayResult(day)
+    start = time.time()
+    try:
+        solver_cls = registry.load(day)
+        data = solver_cls.get_input(input_dir=input_dir, scale=scale, seed=seed)
+        digest = cache.key(day, registry.module_name(day), data)
+        solution = cache.get(digest) if use_cache else None
+        if solution is not None:
+            res.cached = True
+        else:
+            phases, failure = solve_isolated(day, data, budget or Budget())
+            for phase in phases:
+                if phase.phase != "parse":
+                    setattr(res, phase.phase, phase.answer)
+                setattr(res, f"{phase.phase}_elapsed", phase.elapsed)
+            if failure is not None:
+                res.error = failure.error
+                res.failed_phase = failure.phase
+            else:
+                parse, part1, part2 = phases
+                solution = TimedSolution(
+                    part1.answer,
+                    part2.answer,
+                    parse.elapsed_ns,
+                    part1.elapsed_ns,
+                    part2.elapsed_ns,
+                )
+                cache.put(digest, solution)
+        if solution is not None:
+            res.part1 = solution.part1
+            res.part2 = solution.part2
+            res.parse_elapsed = solution.parse_ns / 1e9
+            res.part1_elapsed = solution.part1_ns / 1e9
+            res.part2_elapsed = solution.part2_ns / 1e9
+    except Exception as e:
+        logging.getLogger().exception(f"Day {day} failed")
+        res.error = f"{type(e).__name__}: {e}"
+    res.wall = time.time() - start
+    return res
+
+
+def solve_in_child(
+    day: int,
+    data: str | Source,
+    memory: int | None,
+    log_level: int,
+    conn: Connection,
+) -> None:
+    setup_logging(log_level)
+    if memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    done = 0
+    try:
+        for res in registry.load(day).phases(data):
+            conn.send(res)
+            done += 1
+    except Exception as e:
+        if caused_by_memory_error(e):
+            conn.send(PhaseFailure(PHASES[done], "OOM"))
+        else:
+            logging.getLogger().exception(f"Day {day} failed")
+            conn.send(PhaseFailure(PHASES[done], f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def caused_by_memory_error(e: BaseException | None) -> bool:
+    # Running out of memory mid-import surfaces as an ImportError (or similar)
+    # wrapping the MemoryError
+    while e is not None:
+        if isinstance(e, MemoryError):
+            return True
+        e = e.__cause__ or e.__context__
+    return False
+
+
+def exit_reason(exitcode: int | None, budget: Budget) -> str:
+    if exitcode is None or exitcode >= 0:
+        return f"Exited with code {exitcode}"
+    sig = signal.Signals(-exitcode)
+    # Native code tends to abort when an allocation fails, and the kernel's OOM
+    # killer uses SIGKILL
+    if budget.memory is not None and sig in (signal.SIGABRT, signal.SIGKILL):
+        return f"OOM ({sig.name})"
+    return f"Killed by {sig.name}"
+
+
+def solve_isolated(
+    day: int, data: str | Source, budget: Budget
+) -> tuple[list[PhaseResult], PhaseFailure | None]:
+    # A runaway part only takes down its own process. forkserver rather than
+    # fork because we're starting these from threads.
+    ctx = multiprocessing.get_context("forkserver")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    log_level = logging.getLogger().getEffectiveLevel()
+    proc = ctx.Process(
+        target=solve_in_child,
+        args=(day, data, budget.memory, log_level, send_conn),
+        name=f"day{day:02d}",
+    )
+    proc.start()
+    send_conn.close()
+
+    phases: list[PhaseResult] = []
+    failure = None
+    try:
+        for phase in PHASES:
+            if not recv_conn.poll(budget.timeout):
+                failure = PhaseFailure(phase, "TIMEOUT")
+                break
+            try:
+                msg = recv_conn.recv()
+            except EOFError:
+                proc.join()
+                failure = PhaseFailure(phase, exit_reason(proc.exitcode, budget))
+                break
+            if isinstance(msg, PhaseFailure):
+                failure = msg
+                break
+            phases.append(msg)
+    finally:
+        recv_conn.close()
+        if failure is not None:
+            proc.kill()
+        proc.join()
+    return phases, failure
+
+
+def run_all(
+    days: list[int],
+    jobs: int,
+    input_dir: pathlib.Path | None = None,
+    scale: int | None = None,
+    seed: int = 0,
+    use_cache: bool = True,
+    budget: Budget | None = None,
+) -> list[DayResult]:
+    order = schedule(days, load_timings())
+    run = functools.partial(
+        run_day,
+        input_dir=input_dir,
+        scale=scale,
+        seed=seed,
+        use_cache=use_cache,
+        budget=budget,
+    )
+    # Every day runs in its own child process, these threads just supervise them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(run, order))
+    return sorted(results, key=lambda res: res.day)
+
+
+def summary(results: list[DayResult], elapsed: float) -> Table:
+    table = Table(title=f"Advent of Code 2023 (took {elapsed:.2f}s)")
+    table.add_column("Day", justify="right")
+    table.add_column("Part 1", justify="right")
+    table.add_column("Part 2", justify="right")
+    table.add_column("Parse time", justify="right")
+    table.add_column("Part 1 time", justify="right")
+    table.add_column("Part 2 time", justify="right")
+    table.add_column("Wall time", justify="right")
+    table.add_column("Cached")
+    for res in results:
+        # Errors from before part 1 (loading input, parsing) show up under part 1
+        error_phase = res.failed_phase
+        if error_phase in (None, "parse"):
+            error_phase = "part1"
+        answers = []
+        for phase in ("part1", "part2"):
+            if res.completed(phase):
+                answers.append(str(getattr(res, phase)))
+            elif phase == error_phase:
+                answers.append(f"[red]{res.error}")
+            else:
+                answers.append("")
+        times = [
+            f"{getattr(res, f'{phase}_elapsed'):.2f}s" if res.completed(phase) else ""
+            for phase in PHASES
+        ]
+        table.add_row(
+            str(res.day),
+            *answers,
+            *times,
+            f"{res.wall:.2f}s",
+            "yes" if res.cached else "",
+        )
+    return table
+
+
+def configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("days", nargs="*", type=int, help="Days to run (default: all)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of days to run at once (default: core count)",
+    )
+    parser.add_argument(
+        "--input-dir", type=pathlib.Path, help="Read inputs from DIR/dayNN.txt"
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        help="Solve generated inputs N times the size of the real ones",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for --scale (default: 0)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Kill a day if any one phase takes longer than this many seconds",
+    )
+    parser.add_argument(
+        "--mem-limit",
+        type=float,
+        help="Cap each day's address space at this many MiB",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Solve everything again instead of reusing cached results",
+    )
+    parser.set_defaults(func=main)
+
+
+def main(args: argparse.Namespace) -> None:
+    start = time.time()
+    results = run_all(
+        args.days or registry.days(),
+        args.jobs,
+        args.input_dir,
+        args.scale,
+        args.seed,
+        use_cache=not args.no_cache,
+        budget=Budget(
+            timeout=args.timeout,
+            memory=None if args.mem_limit is None else int(args.mem_limit * 2**20),
+        ),
+    )
+    elapsed = time.time() - start
+    # Only real inputs are worth remembering for scheduling
+    if args.scale is None:
+        save_timings(results)
+    Console().print(summary(results, elapsed))
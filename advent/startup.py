@@ -0,0 +1,125 @@
+import argparse
+import dataclasses
+import functools
+import subprocess
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from advent import registry
+from advent.colors import red
+
+
+@dataclasses.dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def _run_importtime(code: str) -> list[ImportTime]:
+    # Run in a fresh interpreter so nothing is already cached in sys.modules
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    res = []
+    for line in proc.stderr.splitlines():
+        # import time:       123 |        456 |   package.module
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        res.append(ImportTime(name.strip(), int(self_us), int(cumulative_us), depth))
+    return res
+
+
+@functools.cache
+def bootstrap_modules() -> frozenset[str]:
+    # What the interpreter imports before running anything at all (site,
+    # encodings, ...), which no solver has any control over
+    return frozenset(t.module for t in _run_importtime("pass"))
+
+
+def import_times(module: str) -> list[ImportTime]:
+    # Each module is only imported once, so anything bootstrap imported can't
+    # also be part of importing module
+    bootstrap = bootstrap_modules()
+    return [t for t in _run_importtime(f"import {module}") if t.module not in bootstrap]
+
+
+def total_us(times: list[ImportTime]) -> int:
+    return sum(t.cumulative_us for t in times if t.depth == 0)
+
+
+def direct_imports(times: list[ImportTime], module: str) -> list[ImportTime]:
+    # -X importtime prints children before their parent, so the module's own
+    # imports are the depth 1 entries right before it
+    res = []
+    idx = next(i for i, t in enumerate(times) if t.module == module)
+    for t in reversed(times[:idx]):
+        if t.depth == 0:
+            break
+        if t.depth == 1:
+            res.append(t)
+    return res
+
+
+def report(module: str, top: int = 25) -> Table:
+    times = import_times(module)
+    table = Table(title=f"import {module} (took {total_us(times) / 1000:.1f}ms)")
+    table.add_column("Module")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right")
+    for t in sorted(times, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        table.add_row(
+            t.module,
+            f"{t.self_us / 1000:.1f}",
+            f"{t.cumulative_us / 1000:.1f}",
+        )
+    return table
+
+
+def configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "days", nargs="*", type=int, help="Days to check (default: all)"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="Fail if importing any day takes longer than this",
+    )
+    parser.set_defaults(func=main)
+
+
+def main(args: argparse.Namespace) -> None:
+    table = Table(title="Cold import time")
+    table.add_column("Day", justify="right")
+    table.add_column("Import (ms)", justify="right")
+    table.add_column("Slowest dependency")
+    over_budget = []
+    for day in args.days or registry.days():
+        times = import_times(registry.module_name(day))
+        total_ms = total_us(times) / 1000
+        deps = direct_imports(times, registry.module_name(day))
+        slowest = max(deps, key=lambda t: t.cumulative_us, default=None)
+        slowest_str = ""
+        if slowest is not None:
+            slowest_str = f"{slowest.module} ({slowest.cumulative_us / 1000:.1f}ms)"
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append(day)
+        table.add_row(
+            str(day),
+            f"[red]{total_ms:.1f}" if day in over_budget else f"{total_ms:.1f}",
+            slowest_str,
+        )
+    Console().print(table)
+
+    if over_budget:
+        days = ", ".join(str(day) for day in over_budget)
+        print(red(f"Over the {args.budget_ms}ms startup budget: {days}"))
+        sys.exit(1)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import functools
+import re
+
+import numpy as np
+
+from advent.reader import int_array
+
+INT_RE = re.compile(rb"-?\d+")
+
+
+class InputView:
+    """Parsed views over the raw input, each built once and then shared.
+
+    Everything here works on a single bytes copy of the input, and the grid is a
+    strided view into those bytes rather than a copy.
+    """
+
+    def __init__(self, data: str) -> None:
+        self.raw = data.encode()
+        self.buf = np.frombuffer(self.raw, dtype=np.uint8)
+
+    @functools.cached_property
+    def line_offsets(self) -> np.ndarray:
+        # Start offset of every line, plus a sentinel one past the end of the last
+        # line (as if it were newline terminated) so line i is
+        # raw[offsets[i]:offsets[i + 1] - 1]
+        newlines = np.flatnonzero(self.buf == ord("\n"))
+        starts = np.concatenate(([0], newlines + 1))
+        if len(self.raw) == 0 or self.raw.endswith(b"\n"):
+            return starts
+        return np.append(starts, len(self.raw) + 1)
+
+    @property
+    def num_lines(self) -> int:
+        return len(self.line_offsets) - 1
+
+    def line(self, i: int) -> str:
+        lo, hi = self.line_offsets[i], self.line_offsets[i + 1] - 1
+        return self.raw[lo:hi].decode()
+
+    @functools.cached_property
+    def grid(self) -> np.ndarray:
+        # Every row of a grid input has the same width, so the rows sit at a fixed
+        # stride in the buffer (width + 1 for the newline) and we can view them
+        # as a 2-D array without copying anything.
+        lengths = np.diff(self.line_offsets) - 1
+        # Trailing blank lines aren't part of the grid
+        rows = len(lengths)
+        while rows > 0 and lengths[rows - 1] == 0:
+            rows -= 1
+        cols = int(lengths[0]) if rows > 0 else 0
+        if not np.all(lengths[:rows] == cols):
+            raise ValueError("Input is not a rectangular grid")
+        grid = np.lib.stride_tricks.as_strided(
+            self.buf, shape=(rows, cols), strides=(cols + 1, 1), writeable=False
+        )
+        return grid
+
+    @property
+    def rows(self) -> int:
+        return self.grid.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.grid.shape[1]
+
+    @functools.cached_property
+    def ints(self) -> np.ndarray:
+        # The regex only finds the tokens; joining them lets int_array parse every
+        # one in a single C call instead of building a Python int for each
+        return int_array(b" ".join(INT_RE.findall(self.raw)).decode())
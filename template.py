@@ -14,4 +14,5 @@ class Solver(BaseSolver):
         yield None
 
 
-Solver.run()
+if __name__ == "__main__":
+    Solver.run()